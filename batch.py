@@ -0,0 +1,203 @@
+from main import RAYS, NEIGHBOURS
+from random import Random
+
+import numpy as np
+
+
+# Slide tables
+# Occupied cells of every game are kept as uint64 bitboard (bit row * 5 + column).
+# Target of slide from cell along direction depends only on occupied cells of the ray, which are mapped
+# to 5-bit index by magic multiplication: ((occupied & RAY_MASKS[cell, direction]) * MAGICS[cell, direction]) >> 59.
+def build_slide_tables(seed=0):
+    """
+    Returns ray masks (25, 8), magic numbers (25, 8) and targets (25 * 8 * 32) of slides, -1 if slide is blocked.
+    """
+    rng = Random(seed)
+    ray_masks = np.zeros((25, 8), dtype=np.uint64)
+    magics = np.zeros((25, 8), dtype=np.uint64)
+    targets = np.full((25, 8, 32), -1, dtype=np.intp)
+    for cell in range(25):
+        for direction, ray in enumerate(RAYS[cell]):
+            ray_masks[cell, direction] = sum(1 << ray_cell for ray_cell in ray)
+
+            # All patterns of occupied cells along the ray and target for each of them
+            patterns = []
+            for pattern in range(1 << len(ray)):
+                steps = 0
+                while steps < len(ray) and not pattern >> steps & 1:
+                    steps += 1
+                occupied = sum(1 << ray[step] for step in range(len(ray)) if pattern >> step & 1)
+                patterns.append((occupied, ray[steps - 1] if steps > 0 else -1))
+
+            # Random sparse magic that doesn't map different targets to the same index
+            found = False
+            while not found:
+                magic = rng.getrandbits(64) & rng.getrandbits(64) & rng.getrandbits(64)
+                indices = {}
+                found = True
+                for occupied, target in patterns:
+                    index = (occupied * magic & 0xFFFFFFFFFFFFFFFF) >> 59
+                    if indices.setdefault(index, target) != target:
+                        found = False
+                        break
+            magics[cell, direction] = magic
+            for index, target in indices.items():
+                targets[cell, direction, index] = target
+    return ray_masks, magics, targets.reshape(-1)
+
+
+RAY_MASKS, MAGICS, SLIDE_TARGETS = build_slide_tables()
+NEIGHBOUR_MASKS = np.array(NEIGHBOURS, dtype=np.uint64)
+CELL_BITS = np.left_shift(np.uint64(1), np.arange(25, dtype=np.uint64))
+DIRECTION_OFFSETS = np.arange(0, 256, 32)
+
+
+def random_policy(batch, games, targets):
+    """
+    Policy choosing random legal target. Returns index of target in last axis of targets,
+    -1 for games without legal target.
+    """
+    keys = batch.rng.random(targets.shape, dtype=np.float32)
+    keys[targets < 0] = -1
+    return np.where((targets >= 0).any(axis=-1), keys.argmax(axis=-1), -1)
+
+
+class BatchGame:
+    """
+    Many games played at once with vectorized operations.
+    Every game is kept as occupied cells (uint64 bitboard), cell of neutron and cells of pawns of both players.
+    Turns follow Game.play(): random player starts, first turn has no neutron slide,
+    game ends when neutron reaches home row or is blocked. Game where player can't move any pawn is a draw.
+    :params games: Number of games.
+    :params boards: Starting boards (N, 5, 5) with 5 pawns of each player, None uses starting position.
+    :params seed: Seed of random generator.
+    """
+    def __init__(self, games=None, boards=None, seed=None):
+        self.rng = np.random.default_rng(seed)
+        self.reset(games, boards)
+
+    def reset(self, games=None, boards=None):
+        """
+        Resets all games.
+        """
+        if boards is None:
+            boards = np.zeros((games, 25), dtype=np.int8)
+            boards[:, 0:5] = 2
+            boards[:, 12] = 3
+            boards[:, 20:25] = 1
+            self.first_turn = np.ones(len(boards), dtype=bool)
+        else:
+            boards = np.asarray(boards, dtype=np.int8).reshape(-1, 25)
+            self.first_turn = np.zeros(len(boards), dtype=bool)
+
+        games = len(boards)
+        self.occupied = np.bitwise_or.reduce(np.where(boards != 0, CELL_BITS, np.uint64(0)), axis=1)
+        self.neutron = np.argmax(boards == 3, axis=1)
+        self.pawns = np.stack([
+            np.nonzero(boards == 1)[1].reshape(games, 5),
+            np.nonzero(boards == 2)[1].reshape(games, 5),
+        ], axis=1)
+        self.player = self.rng.integers(1, 3, games, dtype=np.int8)
+        self.winner = self.get_winners(np.arange(games))
+        self.turns = 0
+        self.positions = 0
+
+    @property
+    def boards(self):
+        """
+        Boards as (N, 5, 5) int8 array.
+        """
+        games = np.arange(len(self.neutron))
+        boards = np.zeros((len(games), 25), dtype=np.int8)
+        boards[games[:, None], self.pawns[:, 0]] = 1
+        boards[games[:, None], self.pawns[:, 1]] = 2
+        boards[games, self.neutron] = 3
+        return boards.reshape(-1, 5, 5)
+
+    def slide_targets(self, games, origins):
+        """
+        Returns targets (origins.shape + (8,)) of slides in all directions, -1 if direction is blocked.
+
+        :param games: Indices of games
+        :type games: numpy array
+
+        :param origins: Cells of moved pawns, first axis is game
+        :type origins: numpy array
+        """
+        occupied = self.occupied[games].reshape(games.shape + (1,) * origins.ndim)
+        indices = (occupied & RAY_MASKS[origins]) * MAGICS[origins] >> np.uint64(59)
+        return SLIDE_TARGETS[(origins * 256)[..., None] + DIRECTION_OFFSETS + indices.astype(np.intp)]
+
+    def get_winners(self, games):
+        """
+        Returns winners of given games like Game.get_winner(), 0 if game is not finished.
+        """
+        neutrons = self.neutron[games]
+        rows = neutrons // 5
+        neighbours = NEIGHBOUR_MASKS[neutrons]
+        blocked = self.occupied[games] & neighbours == neighbours
+        return np.where(rows == 0, 2, np.where(rows == 4, 1, np.where(blocked, 3, 0))).astype(np.int8)
+
+    def step(self, neutron_policy=None, pawn_policy=None):
+        """
+        Plays one turn in all running games. Returns number of games that moved.
+        Policy is called as policy(batch, games, targets) and returns index of chosen target in last axis
+        of targets (8 neutron directions or 5 pawns * 8 directions), None uses random_policy().
+        Policies are called only for games with at least one legal target.
+        Game where neutron or player's pawns can't move is a draw.
+        """
+        if neutron_policy is None:
+            neutron_policy = random_policy
+        if pawn_policy is None:
+            pawn_policy = random_policy
+
+        games = np.flatnonzero(self.winner == 0)
+        if games.size == 0:
+            return 0
+
+        # Neutron turn
+        moving = games[~self.first_turn[games]]
+        if moving.size:
+            neutrons = self.neutron[moving]
+            targets = self.slide_targets(moving, neutrons)
+            legal = (targets >= 0).any(axis=1)
+            self.winner[moving[~legal]] = 3
+            moving, neutrons, targets = moving[legal], neutrons[legal], targets[legal]
+            target = targets[np.arange(len(moving)), neutron_policy(self, moving, targets)]
+            self.occupied[moving] ^= CELL_BITS[neutrons] | CELL_BITS[target]
+            self.neutron[moving] = target
+            self.winner[moving] = self.get_winners(moving)
+        self.first_turn[games] = False
+
+        # Pawn turn
+        running = games[self.winner[games] == 0]
+        if running.size:
+            players = self.player[running] - 1
+            pawns = self.pawns[running, players]
+            targets = self.slide_targets(running, pawns).reshape(len(running), -1)
+            legal = (targets >= 0).any(axis=1)
+            self.winner[running[~legal]] = 3
+            running, players, pawns, targets = running[legal], players[legal], pawns[legal], targets[legal]
+
+            chosen = pawn_policy(self, running, targets)
+            index = np.arange(len(running))
+            target = targets[index, chosen]
+            origin = pawns[index, chosen // 8]
+            self.occupied[running] ^= CELL_BITS[origin] | CELL_BITS[target]
+            self.pawns[running, players, chosen // 8] = target
+            self.winner[running] = self.get_winners(running)
+
+        self.player[games] = 3 - self.player[games]
+        self.turns += 1
+        self.positions += len(games)
+        return len(games)
+
+    def play(self, max_turns=1000, neutron_policy=None, pawn_policy=None):
+        """
+        Plays all games to the end. Games stopped after max_turns are draws.
+        Returns array of winners (1, 2 or 3 for draw).
+        """
+        while self.turns < max_turns and self.step(neutron_policy, pawn_policy):
+            pass
+        self.winner[self.winner == 0] = 3
+        return self.winner.copy()
@@ -0,0 +1,205 @@
+from main import Board, BitBoard, Game
+from players import Player, RandomBot, SmartBot
+from simulation import play_games
+from random import Random
+from timeit import Timer
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+
+
+# Benchmarks
+# Every benchmark is a function taking list of positions (boards as lists of lists) and returning
+# function without arguments that is timed. Positions and random generators use fixed seeds,
+# so every run measures the same work.
+def benchmark_positions(count=20, seed=0):
+    """
+    Returns unfinished positions (boards as lists of lists) reached by random turns from starting position.
+    """
+    rng = Random(seed)
+    positions = []
+    while len(positions) < count:
+        board = Board()
+        for turn in range(rng.randint(1, 15)):
+            rows = [row[:] for row in board.get_board()]
+            if turn > 0:
+                neutron = board.get_neutron()
+                board.replace(neutron, rng.choice(board.get_all_max_paths(neutron)))
+            player = Player(turn % 2 + 1)
+            if board.get_neutron_winner(player) is not None:
+                board = Board(custom=rows)
+                break
+            pawn = rng.choice(board.get_possible_pawns(player))
+            board.replace(pawn, rng.choice(board.get_all_max_paths(pawn)))
+            if board.get_winner() is not None:
+                board = Board(custom=rows)
+                break
+        positions.append([row[:] for row in board.get_board()])
+    return positions
+
+
+def bench_get_all_max_paths(board_class):
+    def setup(positions):
+        boards = [board_class(custom=[row[:] for row in rows]) for rows in positions]
+        pawns = [[pawn for id in (1, 2, 3) for pawn in board.get_pawns_by_id(id)] for board in boards]
+
+        def run():
+            for board, board_pawns in zip(boards, pawns):
+                board.clear_moves_cache()
+                for pawn in board_pawns:
+                    board.get_all_max_paths(pawn)
+        return run
+    return setup
+
+
+def bench_get_possible_pawns(board_class):
+    def setup(positions):
+        boards = [board_class(custom=[row[:] for row in rows]) for rows in positions]
+        players = [Player(1), Player(2)]
+
+        def run():
+            for board in boards:
+                board.clear_moves_cache()
+                for player in players:
+                    board.get_possible_pawns(player)
+        return run
+    return setup
+
+
+def bench_get_winner(positions):
+    game = Game(video_mode=1, game_mode=4)
+    boards = [Board(custom=[row[:] for row in rows]) for rows in positions]
+
+    def run():
+        for board in boards:
+            game.board = board
+            game.get_winner()
+    return run
+
+
+def bench_bot_move(player_class):
+    def setup(positions):
+        boards = [BitBoard(custom=[row[:] for row in rows]) for rows in positions]
+        bots = [player_class(1), player_class(2)]
+
+        def run():
+            random.seed(0)
+            for board in boards:
+                for bot in bots:
+                    board.clear_moves_cache()
+                    if board.get_possible_pawns(bot) != []:
+                        pawn = bot.get_selected_pawn(board, None)
+                        bot.get_selected_target(pawn, board, None)
+        return run
+    return setup
+
+
+def bench_headless_games(positions):
+    def run():
+        play_games(SmartBot, RandomBot, 20, seed=0)
+    return run
+
+
+def bench_gui_frame(positions):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    from interfaces import GUI
+    gui = GUI(Board())
+    boards = [Board(custom=[row[:] for row in rows]) for rows in positions]
+    player = Player(1)
+
+    def run():
+        for board in boards:
+            gui.board = board
+            gui.drawn_cells = None
+            gui.print_header("Player's 1 Turn")
+            gui.print_possible_pawns(player)
+            gui.present()
+    return run
+
+
+BENCHMARKS = {
+    "board.get_all_max_paths": bench_get_all_max_paths(Board),
+    "bitboard.get_all_max_paths": bench_get_all_max_paths(BitBoard),
+    "board.get_possible_pawns": bench_get_possible_pawns(Board),
+    "bitboard.get_possible_pawns": bench_get_possible_pawns(BitBoard),
+    "game.get_winner": bench_get_winner,
+    "randombot.move": bench_bot_move(RandomBot),
+    "smartbot.move": bench_bot_move(SmartBot),
+    "simulation.headless_games": bench_headless_games,
+    "gui.frame": bench_gui_frame,
+}
+
+
+def run_benchmarks(names=None, repeat=5, min_time=0.2, positions=None):
+    """
+    Runs benchmarks and returns dictionary of best time of one run (seconds) by benchmark name.
+    Benchmark is run in loops taking at least min_time and best of repeat loops is taken.
+    Benchmarks that can't run (e.g. GUI without pygame) are skipped.
+
+    :param names: Names of benchmarks (see BENCHMARKS), None runs all of them
+    :type names: list of str
+    """
+    if positions is None:
+        positions = benchmark_positions()
+    results = {}
+    for name in names or BENCHMARKS:
+        try:
+            timer = Timer(BENCHMARKS[name](positions))
+        except ImportError:
+            continue
+        number = 1
+        while timer.timeit(number) < min_time:
+            number *= 2
+        results[name] = min(timer.repeat(repeat, number)) / number
+    return results
+
+
+def compare(results, baseline, tolerance=0.2):
+    """
+    Returns list of (name, time, baseline time) of benchmarks slower than baseline by more than tolerance.
+    """
+    return [
+        (name, seconds, baseline[name])
+        for name, seconds in results.items()
+        if name in baseline and seconds > baseline[name] * (1 + tolerance)
+    ]
+
+
+def save_baseline(path, results):
+    with open(path, "w") as file:
+        json.dump({"python": platform.python_version(), "machine": platform.machine(), "benchmarks": results}, file, indent=4, sort_keys=True)
+
+
+def load_baseline(path):
+    with open(path) as file:
+        return json.load(file)["benchmarks"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Times Board, players, headless games and GUI rendering.")
+    parser.add_argument("names", nargs="*", help="Benchmarks to run (default: all)")
+    parser.add_argument("-s", "--save", metavar="FILE", help="Save results as JSON baseline")
+    parser.add_argument("-c", "--compare", metavar="FILE", help="Compare results with JSON baseline, exit with 1 on regression")
+    parser.add_argument("-t", "--tolerance", type=float, default=0.2, help="Allowed slowdown against baseline (default: 0.2)")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Number of timed loops, best one is taken")
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.compare) if args.compare else {}
+    results = run_benchmarks(args.names, args.repeat)
+    for name, seconds in results.items():
+        line = f"{name:30} {seconds * 1e6:12.1f} us"
+        if name in baseline:
+            line += f" {seconds / baseline[name]:8.2f}x baseline"
+        print(line)
+
+    if args.save:
+        save_baseline(args.save, results)
+    regressions = compare(results, baseline, args.tolerance)
+    for name, seconds, baseline_seconds in regressions:
+        print(f"\033[91mRegression: {name} {seconds * 1e6:.1f} us (baseline {baseline_seconds * 1e6:.1f} us)\033[0m")
+    if regressions:
+        sys.exit(1)
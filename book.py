@@ -0,0 +1,187 @@
+from main import BitBoard, NO_SLIDE, encode_slide
+from players import Player
+from records import RecordWriter, read_records
+from simulation import play_game
+from transposition import canonical_key, mirror_turn
+from io import BytesIO
+from mmap import mmap, ACCESS_READ
+from struct import Struct
+from time import perf_counter
+
+import argparse
+import random
+import players as player_classes
+
+
+# Opening book
+# Book is sorted list of entries (canonical position key, canonical encoded turn, games, score),
+# where score is sum of results of player who made the turn (2 for win, 1 for draw, 0 for loss).
+# Mirrored positions share entries (see transposition.canonical_key()).
+BOOK_MAGIC = b"NOB"
+BOOK_VERSION = 1
+# magic, version, number of entries
+BOOK_HEADER = Struct("<3sBI")
+BOOK_ENTRY = Struct("<QIII")
+
+
+def record_turns(record, turns):
+    """
+    Yields (player id, board before turn, encoded turn) of first turns of recorded game.
+    Board is changed while iterating.
+
+    :param record: Recorded game
+    :type record: records.GameRecord
+
+    :param turns: Number of turns
+    :type turns: int
+    """
+    board = BitBoard()
+    moves = record.replay(board)
+    player_id = record.first_player
+    for turn in range(turns):
+        before = board.get_board()
+        neutron_slide = NO_SLIDE
+        if turn > 0:
+            move = next(moves, None)
+            if move is None:
+                return
+            neutron_slide = encode_slide(*move)
+        pawn_slide = NO_SLIDE
+        if turn == 0 or board.get_neutron_winner(Player(player_id)) is None:
+            move = next(moves, None)
+            if move is None:
+                return
+            pawn_slide = encode_slide(*move)
+        yield player_id, BitBoard(custom=before), neutron_slide << 10 | pawn_slide
+        if board.get_winner() is not None:
+            return
+        player_id = 3 - player_id
+
+
+def build_book(records, turns=8):
+    """
+    Returns sorted list of book entries (key, turn, games, score) from first turns of finished recorded games.
+    """
+    stats = {}
+    for record in records:
+        if record.winner == 0:
+            continue
+        for player_id, board, turn in record_turns(record, turns):
+            key, mirrored = canonical_key(board, player_id)
+            entry = stats.setdefault((key, mirror_turn(turn) if mirrored else turn), [0, 0])
+            entry[0] += 1
+            entry[1] += 2 if record.winner == player_id else 1 if record.winner == 3 else 0
+    return sorted((key, turn, games, score) for (key, turn), (games, score) in stats.items())
+
+
+def self_play(player_1, player_2, games, seed=None):
+    """
+    Plays games between two players and returns their records.
+
+    :param player_1: Player class (or any callable taking id) of player 1
+    :param player_2: Player class (or any callable taking id) of player 2
+    """
+    if seed is not None:
+        random.seed(seed)
+    stream = BytesIO()
+    writer = RecordWriter(stream)
+    _players = [player_1(1), player_2(2)]
+    for game in range(games):
+        play_game(_players, recorder=writer)
+    for player in _players:
+        if hasattr(player, "close"):
+            player.close()
+    stream.seek(0)
+    return list(read_records(stream))
+
+
+def save_book(path, entries):
+    with open(path, "wb") as file:
+        file.write(BOOK_HEADER.pack(BOOK_MAGIC, BOOK_VERSION, len(entries)))
+        for entry in entries:
+            file.write(BOOK_ENTRY.pack(*entry))
+
+
+class OpeningBook:
+    """
+    Opening book read from file created by save_book() through mmap. Entries are found by binary search.
+    :params path: Path of book file.
+    """
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.data = mmap(self.file.fileno(), 0, access=ACCESS_READ)
+        magic, version, self.size = BOOK_HEADER.unpack_from(self.data)
+        if magic != BOOK_MAGIC or version != BOOK_VERSION or len(self.data) != BOOK_HEADER.size + self.size * BOOK_ENTRY.size:
+            self.close()
+            raise ValueError("Not an opening book")
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    def get_key(self, index):
+        return BOOK_ENTRY.unpack_from(self.data, BOOK_HEADER.size + index * BOOK_ENTRY.size)[0]
+
+    def probe(self, board, player_id):
+        """
+        Returns list of (encoded turn, games, score) stored for the position, turns are mapped to the position.
+        """
+        key, mirrored = canonical_key(board, player_id)
+        low = 0
+        high = self.size
+        while low < high:
+            middle = (low + high) // 2
+            if self.get_key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        moves = []
+        for index in range(low, self.size):
+            entry_key, turn, games, score = BOOK_ENTRY.unpack_from(self.data, BOOK_HEADER.size + index * BOOK_ENTRY.size)
+            if entry_key != key:
+                break
+            moves.append((mirror_turn(turn) if mirrored else turn, games, score))
+        return moves
+
+    def best_turn(self, board, player_id, neutron=True, min_games=5):
+        """
+        Returns legal turn with best average score played at least min_games times or None.
+
+        :param neutron: False if turn has no neutron slide (first turn of the game)
+        :type neutron: bool
+        """
+        moves = [move for move in self.probe(board, player_id) if move[1] >= min_games]
+        if moves == []:
+            return None
+        legal = set(board.generate_turns(player_id, neutron))
+        best_turn = None
+        best_score = None
+        for turn, games, score in moves:
+            average = (score + 1) / (2 * games + 2)
+            if turn in legal and (best_score is None or average > best_score):
+                best_score = average
+                best_turn = turn
+        return best_turn
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Builds opening book from self-play or recorded games.")
+    parser.add_argument("path", help="Output book file")
+    parser.add_argument("-r", "--records", nargs="*", default=[], help="Files with recorded games (see records.py)")
+    parser.add_argument("-p", "--players", nargs=2, default=["SmartBot", "SmartBot"], help="Classes of players from players.py for self-play")
+    parser.add_argument("-n", "--games", type=int, default=0, help="Number of self-play games")
+    parser.add_argument("-t", "--turns", type=int, default=8, help="Number of turns of every game in the book")
+    parser.add_argument("-s", "--seed", type=int, default=None, help="Random seed")
+    args = parser.parse_args()
+
+    start = perf_counter()
+    records = []
+    for path in args.records:
+        with open(path, "rb") as file:
+            records += read_records(file)
+    if args.games:
+        records += self_play(getattr(player_classes, args.players[0]), getattr(player_classes, args.players[1]), args.games, args.seed)
+    entries = build_book(records, args.turns)
+    save_book(args.path, entries)
+    print(f"{len(records)} games, {len(entries)} entries in {perf_counter() - start:.2f} s")
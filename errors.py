@@ -20,3 +20,11 @@ class BlockedPawn(Exception):
 
 class ModeNotExist(Exception):
     pass
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class GameOver(Exception):
+    pass
@@ -1,11 +1,71 @@
 from errors import WrongPawn, WrongData, WrongCoordinates, WrongTarget, BlockedPawn
-import pygame
+from collections import OrderedDict
+from shutil import get_terminal_size
+from time import sleep
 import sys
 
+# pygame is imported by GUI on first use, so text mode and bots don't need it
+pygame = None
+
+
+def import_pygame():
+    """
+    Imports pygame (only once) and returns it.
+    """
+    global pygame
+    if pygame is None:
+        import pygame as _pygame
+        pygame = _pygame
+    return pygame
+
+
+# Text frame
+# Header is on the first line of the terminal, column numbers on line 3, board rows on lines 4-8, messages and input below it.
+# Cells are 3 characters wide, cell (row, column) starts in terminal column 3 + column * 3.
+TEXT_CELLS = {
+    0: " 0 ",
+    1: " \033[92m1\033[0m ",
+    2: " \033[91m2\033[0m ",
+    3: " \033[94m3\033[0m ",
+}
+TEXT_BOARD_LINE = 4
+TEXT_MESSAGES_LINE = 10
+
 
 class TextInterface:
-    def __init__(self, board):
+    def __init__(self, board, output=None):
         self.board = board
+        # Stream for frames and messages, None uses sys.stdout
+        self.output = output
+
+        # drawn_cells[row * 5 + column] is pawn id shown on the terminal, None if frame is not drawn
+        self.drawn_cells = None
+        self.drawn_header = None
+        self.message_lines = 0
+
+    def write(self, text):
+        """
+        Writes text with one call and counts lines written under the frame.
+        """
+        output = self.output or sys.stdout
+        output.write(text)
+        output.flush()
+        self.message_lines += text.count("\n")
+
+    def read(self, prompt):
+        """
+        Asks for input under the frame.
+        """
+        self.write(prompt)
+        self.message_lines += 1
+        return input()
+
+    def invalidate(self):
+        """
+        Marks frame as not drawn, next frame clears the terminal.
+        """
+        self.drawn_cells = None
+        self.drawn_header = None
 
     def select_pawn(self, player, test=None):
         """
@@ -13,7 +73,7 @@ class TextInterface:
         Returns coordinates (tuple).
         """
         if test is None:
-            _pawn = input("Select pawn (row, column):\n").replace(" ", "")
+            _pawn = self.read("Select pawn (row, column):\n").replace(" ", "")
         else:
             _pawn = test
         _pawn = _pawn.split(",")
@@ -50,7 +110,7 @@ class TextInterface:
         Returns coordinates (tuple).
         """
         if test is None:
-            _target = input("Select target (row, column):\n").replace(" ", "")
+            _target = self.read("Select target (row, column):\n").replace(" ", "")
         else:
             _target = test
         _target = _target.split(",")
@@ -82,20 +142,20 @@ class TextInterface:
         Asks player for game mode.
         Returns game mode id (int).
         """
+        self.invalidate()
         mode_chose = False
         while not mode_chose:
             try:
-                print("\033[93mChoose game mode:\n1: One player mode with easy computer\n2: One player mode with hard computer\n3: Two players mode\n4: AI mode\033[0m")
-                game_mode = input()
+                game_mode = self.read("\033[93mChoose game mode:\n1: One player mode with easy computer\n2: One player mode with hard computer\n3: Two players mode\n4: AI mode\n5: One player mode with search computer\033[0m\n")
             except KeyboardInterrupt:
                 sys.exit()
             except EOFError:
                 sys.exit()
 
-            if game_mode in ["1", "2", "3", "4"]:
+            if game_mode in ["1", "2", "3", "4", "5"]:
                 mode_chose = True
             else:
-                print("Invalid input. Try again.")
+                self.write("Invalid input. Try again.\n")
         return game_mode
 
     def select_game_end(self, winner):
@@ -103,11 +163,11 @@ class TextInterface:
         Asks player how to end the game.
         Returns winner id or exits the game.
         """
+        self.invalidate()
         game_end_chose = False
         while not game_end_chose:
             try:
-                print("\033[93mDo you want to end the game?\n1: Yes\n2: No\033[0m")
-                game_end = input()
+                game_end = self.read("\033[93mDo you want to end the game?\n1: Yes\n2: No\033[0m\n")
             except KeyboardInterrupt:
                 sys.exit()
             except EOFError:
@@ -119,65 +179,117 @@ class TextInterface:
                 return winner
                 game_end_chose = True
             else:
-                print("Invalid input. Try again.")
+                self.write("Invalid input. Try again.\n")
 
     def print_error(self, error):
-        print(f"\033[91m{error}\033[0m")
+        self.write(f"\033[91m{error}\033[0m\n")
 
     def print_all_max_paths(self, origin_coordinates):
-        print(f"Possible targets:")
-        for path in self.board.get_all_max_paths(origin_coordinates)[:-1]:
-            print(f"{path}, ", end="")
-        print(f"{self.board.get_all_max_paths(origin_coordinates)[-1]}")
+        paths = self.board.get_all_max_paths(origin_coordinates)
+        self.write("Possible targets:\n" + ", ".join(str(path) for path in paths) + "\n")
 
     def print_possible_pawns(self, player):
-        print(f"Possible pawns:")
-        for pawn in self.board.get_possible_pawns(player)[:-1]:
-            print(f"{pawn}, ", end="")
-        print(f"{self.board.get_possible_pawns(player)[-1]}")
+        pawns = self.board.get_possible_pawns(player)
+        self.write("Possible pawns:\n" + ", ".join(str(pawn) for pawn in pawns) + "\n")
 
-    def print_background(self):
-        print(f"  ", end="")
-        for col in range(5):
-            print(f" \033[93m{col}\033[0m ", end="")
-        print()
-
-        for row in range(5):
-            print(f"\033[93m{row}\033[0m ", end="")
-            for col in range(5):
-                if self.board.get_pawn((row, col)) == 1:
-                    print(f" \033[92m1\033[0m ", end="")
-                elif self.board.get_pawn((row, col)) == 2:
-                    print(f" \033[91m2\033[0m ", end="")
-                elif self.board.get_pawn((row, col)) == 3:
-                    print(f" \033[94m3\033[0m ", end="")
-                else:
-                    print(f" {self.board.get_pawn((row, col))} ", end="")
-            print()
-        print()
+    def print_background(self, header=None):
+        """
+        Draws frame with header and board and clears messages under it.
+        First frame is drawn whole, next ones rewrite only changed cells and header using ANSI cursor moves.
+        Frame is drawn whole again if messages could scroll it out of the terminal.
+        """
+        if header is None:
+            header = self.drawn_header or ""
+        board = self.board.get_board()
+        cells = [board[row][column] for row in range(5) for column in range(5)]
+
+        if self.drawn_cells is None or TEXT_MESSAGES_LINE + self.message_lines >= get_terminal_size().lines:
+            frame = [f"\033[2J\033[H\033[93m{header}\033[0m\n\n  "]
+            frame += [f" \033[93m{column}\033[0m " for column in range(5)]
+            for row in range(5):
+                frame.append(f"\n\033[93m{row}\033[0m ")
+                frame += [TEXT_CELLS[cell] for cell in cells[row * 5:row * 5 + 5]]
+            frame.append("\n\n")
+        else:
+            frame = []
+            if header != self.drawn_header:
+                frame.append(f"\033[1;1H\033[2K\033[93m{header}\033[0m")
+            for cell in range(25):
+                if cells[cell] != self.drawn_cells[cell]:
+                    frame.append(f"\033[{TEXT_BOARD_LINE + cell // 5};{3 + cell % 5 * 3}H{TEXT_CELLS[cells[cell]]}")
+            frame.append(f"\033[{TEXT_MESSAGES_LINE};1H\033[J")
+
+        self.write("".join(frame))
+        self.drawn_cells = cells
+        self.drawn_header = header
+        self.message_lines = 0
 
     def print_header(self, header):
-        print(f"\033[93m{header}\033[0m")
-        print()
-        self.print_background()
+        self.print_background(header)
+
+    def wait(self, milliseconds):
+        sleep(milliseconds / 1000)
 
     def print_winner(self, winner):
-        print()
+        self.invalidate()
         if winner == 1:
-            print("\033[93mPlayer 1 wins...\033[0m")
+            self.write("\n\033[93mPlayer 1 wins...\033[0m\n")
         elif winner == 2:
-            print("\033[93mPlayer 2 wins...\033[0m")
+            self.write("\n\033[93mPlayer 2 wins...\033[0m\n")
         else:
-            print("\033[93mDraw...\033[0m")
+            self.write("\n\033[93mDraw...\033[0m\n")
+
+
+# Sprite atlas
+# Pawns and highlights are packed in one image, SPRITES maps their names (files in images/) to rectangles in the atlas.
+SPRITE_ATLAS = "images/sprites.png"
+SPRITES = {
+    "r_pawn": (0, 0, 80, 80),
+    "g_pawn": (80, 0, 80, 80),
+    "b_pawn": (160, 0, 80, 80),
+    "active_pawn": (240, 0, 80, 80),
+    "selected_pawn": (320, 0, 90, 90),
+    "selected_target": (410, 0, 90, 90),
+}
+
+
+def build_sprite_atlas(path=SPRITE_ATLAS):
+    """
+    Packs sprites from separate images (images/<name>.png) into the atlas and saves it.
+    """
+    import_pygame()
+    width = max(x + w for x, y, w, h in SPRITES.values())
+    height = max(y + h for x, y, w, h in SPRITES.values())
+    atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+    for name, rect in SPRITES.items():
+        atlas.blit(pygame.image.load(f"images/{name}.png"), rect)
+    pygame.image.save(atlas, path)
 
 
 class GUI:
     def __init__(self, board):
+        import_pygame()
         pygame.init()
 
         self.board = board
         self.screen = pygame.display.set_mode((600, 600))
         pygame.display.set_caption('Neutron')
+        self.font_path = None
+        self.fonts = {}
+        self.texts = OrderedDict()
+        self.texts_size = 64
+
+        # Dirty rectangles rendering
+        # drawn_cells[row * 5 + column] is (pawn id, overlays) drawn on the cell, None if screen doesn't show board
+        self.drawn_cells = None
+        self.drawn_header = None
+        self.drawn_log = False
+        self.dirty = []
+
+        # Event loop sleeps until input, mouse motion never wakes it
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
+        self.idle_timeout = 100
+        self.idle_tasks = []
         try:
             self.load_images()
         except Exception:
@@ -186,81 +298,179 @@ class GUI:
 
     def load_images(self):
         """
-        Loads all images.
+        Loads images needed for the first frame: board and sprite atlas converted to the display format.
+        Sprites are subsurfaces of the atlas, menu and log are loaded on first use.
+        """
+        self.images = {}
+        self.image_board = self.get_image("board.png")
+
+        atlas = pygame.image.load(SPRITE_ATLAS).convert_alpha()
+        sprites = {name: atlas.subsurface(rect) for name, rect in SPRITES.items()}
+        self.red_pawn = sprites["r_pawn"]
+        self.green_pawn = sprites["g_pawn"]
+        self.blue_pawn = sprites["b_pawn"]
+        self.active_pawn = sprites["active_pawn"]
+        self.selected_pawn = sprites["selected_pawn"]
+        self.selected_target = sprites["selected_target"]
+
+        self.pawn_images = {1: self.red_pawn, 2: self.green_pawn, 3: self.blue_pawn}
+
+    def get_image(self, name):
+        """
+        Returns opaque image from images/ converted to the display format. Images are loaded only once.
         """
-        self.image_board = pygame.image.load("images/board.png")
-        self.menu = pygame.image.load("images/menu.png")
-        self.log = pygame.image.load("images/log.png")
+        if name not in self.images:
+            self.images[name] = pygame.image.load(f"images/{name}").convert()
+        return self.images[name]
 
-        self.red_pawn = pygame.image.load("images/r_pawn.png")
-        self.green_pawn = pygame.image.load("images/g_pawn.png")
-        self.blue_pawn = pygame.image.load("images/b_pawn.png")
-        self.active_pawn = pygame.image.load("images/active_pawn.png")
-        self.selected_pawn = pygame.image.load("images/selected_pawn.png")
-        self.selected_target = pygame.image.load("images/selected_target.png")
+    @property
+    def menu(self):
+        return self.get_image("menu.png")
+
+    @property
+    def log(self):
+        return self.get_image("log.png")
+
+    def get_font(self, size=32):
+        """
+        Returns font of given size. System font is searched and fonts are created only once.
+        """
+        if size not in self.fonts:
+            if self.font_path is None:
+                self.font_path = pygame.font.match_font("Calibri", bold=True)
+            self.fonts[size] = pygame.font.Font(self.font_path, size)
+        return self.fonts[size]
+
+    def render_text(self, text, colour, size=32):
+        """
+        Returns rendered text surface. Keeps last rendered texts (texts_size) in LRU cache.
+        """
+        key = (text, colour, size)
+        if key in self.texts:
+            self.texts.move_to_end(key)
+            return self.texts[key]
+
+        surface = self.get_font(size).render(text, True, colour)
+        self.texts[key] = surface
+        if len(self.texts) > self.texts_size:
+            self.texts.popitem(last=False)
+        return surface
+
+    def present(self):
+        """
+        Updates all rectangles of the screen changed since last present.
+        """
+        if self.dirty != []:
+            pygame.display.update(self.dirty)
+            self.dirty = []
+
+    def draw_full_screen(self, image):
+        """
+        Draws image on the whole screen (board is not shown anymore).
+        """
+        self.screen.blit(image, (0, 0))
+        self.drawn_cells = None
+        self.drawn_header = None
+        self.drawn_log = False
+        self.dirty = [self.screen.get_rect()]
+
+    def draw_cell(self, row, column, overlays=()):
+        """
+        Draws cell with pawn and overlays (images drawn over pawn) if it differs from drawn one.
+        """
+        state = (self.board.get_pawn((row, column)), overlays)
+        if self.drawn_cells[row * 5 + column] == state:
+            return
+
+        rect = pygame.Rect(55 + column * 100, 55 + row * 100, 90, 90)
+        self.screen.blit(self.image_board, rect, rect)
+        for image in (self.pawn_images.get(state[0]),) + overlays:
+            if image is not None:
+                self.screen.blit(image, image.get_rect(center=rect.center))
+        self.drawn_cells[row * 5 + column] = state
+        self.dirty.append(rect)
+
+    def add_overlay(self, row, column, image):
+        """
+        Draws image over the cell (over previous overlays).
+        """
+        self.draw_cell(row, column, self.drawn_cells[row * 5 + column][1] + (image,))
+
+    def add_idle_task(self, task):
+        """
+        Adds task (function without arguments) called while GUI waits for player,
+        e.g. checking result of bot computation. Task returning True is removed.
+        Other threads can wake GUI earlier with pygame.event.post(pygame.event.Event(pygame.USEREVENT)).
+        """
+        self.idle_tasks.append(task)
+
+    def run_idle_tasks(self):
+        """
+        Calls all idle tasks and removes finished ones.
+        """
+        self.idle_tasks = [task for task in self.idle_tasks if not task()]
+
+    def wait_for_click(self):
+        """
+        Presents the screen and blocks until left mouse click or exiting the game.
+        Returns position of the click. Wakes every idle_timeout ms (or on USEREVENT) to run idle tasks.
+        """
+        self.present()
+        while True:
+            event = pygame.event.wait(self.idle_timeout)
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit(0)
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                return event.pos
+            elif event.type in (pygame.NOEVENT, pygame.USEREVENT):
+                self.run_idle_tasks()
+            elif event.type == pygame.WINDOWEXPOSED:
+                pygame.display.update()
 
     def select_pawn(self, player):
         """
         Waits for selecting pawn or exiting the game.
         Returns coordinates (tuple).
         """
-        clicked = False
-        while not clicked:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    x, y = event.pos
-                    row = (y - 60) // 100
-                    column = (x - 60) // 100
-
-                    base_x = 55
-                    shift_x = 100
-                    base_y = 55
-                    shift_y = 100
-
-                    # Coordinates not on board
-                    if not self.board.validate_coordinates((row, column)):
-                        raise WrongCoordinates
-
-                    # Not valid pawn
-                    if self.board.get_pawn((row, column)) != player.get_id():
-                        raise WrongPawn
-
-                    # Blocked
-                    if (row, column) not in self.board.get_possible_pawns(player):
-                        raise BlockedPawn
-
-                    self.screen.blit(self.selected_pawn, (base_x + column * shift_x, base_y + row * shift_y))
-                    pygame.display.update()
-                    return (row, column)
+        x, y = self.wait_for_click()
+        row = (y - 60) // 100
+        column = (x - 60) // 100
+
+        # Coordinates not on board
+        if not self.board.validate_coordinates((row, column)):
+            raise WrongCoordinates
+
+        # Not valid pawn
+        if self.board.get_pawn((row, column)) != player.get_id():
+            raise WrongPawn
+
+        # Blocked
+        if (row, column) not in self.board.get_possible_pawns(player):
+            raise BlockedPawn
+
+        self.add_overlay(row, column, self.selected_pawn)
+        self.present()
+        return (row, column)
 
     def select_target(self, pawn):
         """
         Waits for selecting target or exiting the game.
         Returns coordinates (tuple).
         """
-        clicked = False
-        while not clicked:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    x, y = event.pos
-                    row = (y - 60) // 100
-                    column = (x - 60) // 100
+        x, y = self.wait_for_click()
+        row = (y - 60) // 100
+        column = (x - 60) // 100
 
-                    # Coordinates not on board
-                    if not self.board.validate_coordinates((row, column)):
-                        raise WrongCoordinates
+        # Coordinates not on board
+        if not self.board.validate_coordinates((row, column)):
+            raise WrongCoordinates
 
-                    # Not valid target
-                    if (row, column) not in self.board.get_all_max_paths(pawn):
-                        raise WrongTarget
+        # Not valid target
+        if (row, column) not in self.board.get_all_max_paths(pawn):
+            raise WrongTarget
 
-                    return (row, column)
+        return (row, column)
 
     def select_game_mode(self):
         """
@@ -268,13 +478,10 @@ class GUI:
         Returns game mode id (int).
         """
         # Background
-        self.screen.blit(self.menu, (0, 0))
-
-        font = pygame.font.match_font("Calibri", bold=True)
-        font = pygame.font.Font(font, 32)
+        self.draw_full_screen(self.menu)
 
         header = "NEUTRON"
-        text = font.render(header, True, (255, 255, 0))
+        text = self.render_text(header, (255, 255, 0))
         textRect = text.get_rect()
         textRect.center = (300, 50)
         self.screen.blit(text, textRect)
@@ -283,41 +490,31 @@ class GUI:
             ("Choose game mode:", (0, 0, 0)),
             ("One player mode with easy computer", (0, 100, 0)),
             ("One player mode with hard computer", (0, 120, 0)),
-            ("Two players mode:", (0, 140, 0))
+            ("Two players mode:", (0, 140, 0)),
+            ("One player mode with search computer", (0, 160, 0))
         ]
         for line in range(len(texts)):
-            text = font.render(texts[line][0], True, texts[line][1])
+            text = self.render_text(texts[line][0], texts[line][1])
             textRect = text.get_rect()
             textRect.center = (300, 150 + line * 100)
             self.screen.blit(text, textRect)
-        pygame.display.update()
-
-        clicked = False
-        while not clicked:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit(0)
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    x, y = event.pos
-                    if y >= 220 and y <= 270:
-                        return 1
-                    elif y >= 320 and y <= 370:
-                        return 2
-                    elif y >= 420 and y <= 470:
-                        return 3
+
+        while True:
+            x, y = self.wait_for_click()
+            if y >= 220 and y <= 270:
+                return 1
+            elif y >= 320 and y <= 370:
+                return 2
+            elif y >= 420 and y <= 470:
+                return 3
+            elif y >= 520 and y <= 570:
+                return 5
 
     def select_game_end(self, winner):
         """
         Draws end game menu and wait for selecting game end or exiting the game.
         Returns winner id (int).
         """
-        # Background
-        self.screen.blit(self.menu, (0, 0))
-
-        font = pygame.font.match_font("Calibri", bold=True)
-        font = pygame.font.Font(font, 32)
-
         self.print_winner(winner, table=False)
 
         texts = [
@@ -326,95 +523,73 @@ class GUI:
             ("No", (0, 120, 0)),
         ]
         for line in range(len(texts)):
-            text = font.render(texts[line][0], True, texts[line][1])
+            text = self.render_text(texts[line][0], texts[line][1])
             textRect = text.get_rect()
             textRect.center = (300, 150 + line * 100)
             self.screen.blit(text, textRect)
-        pygame.display.update()
-
-        clicked = False
-        while not clicked:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit(0)
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    x, y = event.pos
-                    if y >= 220 and y <= 270:
-                        return None
-                    elif y >= 320 and y <= 370:
-                        return winner
+
+        while True:
+            x, y = self.wait_for_click()
+            if y >= 220 and y <= 270:
+                return None
+            elif y >= 320 and y <= 370:
+                return winner
 
     def print_error(self, error):
         self.screen.blit(self.log, (0, 550))
-        font = pygame.font.match_font("Calibri", bold=True)
-        font = pygame.font.Font(font, 32)
-        text = font.render(error, True, (255, 0, 0))
+        text = self.render_text(error, (255, 0, 0))
         textRect = text.get_rect()
         textRect.center = (300, 575)
         self.screen.blit(text, textRect)
 
-        pygame.display.update()
+        self.drawn_log = True
+        self.dirty.append(pygame.Rect(0, 550, 600, 50))
 
     def print_all_max_paths(self, origin_coordinates):
-        base_x = 55
-        shift_x = 100
-        base_y = 55
-        shift_y = 100
-
-        for row in range(len(self.board.get_board())):
-            for column in range(len(self.board.get_board()[row])):
-                if (row, column) in self.board.get_all_max_paths(origin_coordinates):
-                    self.screen.blit(self.selected_target, (base_x + column * shift_x, base_y + row * shift_y))
-        pygame.display.update()
+        for row, column in self.board.get_all_max_paths(origin_coordinates):
+            self.add_overlay(row, column, self.selected_target)
 
     def print_possible_pawns(self, player):
-        base_x = 60
-        shift_x = 100
-        base_y = 60
-        shift_y = 100
-
-        for row in range(len(self.board.get_board())):
-            for column in range(len(self.board.get_board()[row])):
-                if (row, column) in self.board.get_possible_pawns(player):
-                    self.screen.blit(self.active_pawn, (base_x + column * shift_x, base_y + row * shift_y))
-        pygame.display.update()
+        for row, column in self.board.get_possible_pawns(player):
+            self.add_overlay(row, column, self.active_pawn)
 
     def print_background(self):
-        base_x = 60
-        shift_x = 100
-        base_y = 60
-        shift_y = 100
-
         # Table
-        self.screen.blit(self.image_board, (0, 0))
+        if self.drawn_cells is None:
+            self.draw_full_screen(self.image_board)
+            self.drawn_cells = [None] * 25
+        if self.drawn_log:
+            rect = pygame.Rect(0, 550, 600, 50)
+            self.screen.blit(self.image_board, rect, rect)
+            self.drawn_log = False
+            self.dirty.append(rect)
 
         # Pawns
-        for row in range(len(self.board.get_board())):
-            for column in range(len(self.board.get_board()[row])):
-                if self.board.get_pawn((row, column)) == 1:
-                    self.screen.blit(self.red_pawn, (base_x + column * shift_x, base_y + row * shift_y))
-                elif self.board.get_pawn((row, column)) == 2:
-                    self.screen.blit(self.green_pawn, (base_x + column * shift_x, base_y + row * shift_y))
-                elif self.board.get_pawn((row, column)) == 3:
-                    self.screen.blit(self.blue_pawn, (base_x + column * shift_x, base_y + row * shift_y))
-
-        pygame.display.update()
+        for row in range(5):
+            for column in range(5):
+                self.draw_cell(row, column)
 
     def print_header(self, header, table=True):
         if table:
             self.print_background()
+            background = self.image_board
         else:
-            self.screen.blit(self.menu, (0, 0))
+            self.draw_full_screen(self.menu)
+            background = self.menu
 
-        font = pygame.font.match_font("Calibri", bold=True)
-        font = pygame.font.Font(font, 32)
-        text = font.render(header, True, (0, 0, 0))
-        textRect = text.get_rect()
-        textRect.center = (300, 25)
-        self.screen.blit(text, textRect)
+        if self.drawn_header != header:
+            rect = pygame.Rect(0, 0, 600, 50)
+            self.screen.blit(background, rect, rect)
+            text = self.render_text(header, (0, 0, 0))
+            textRect = text.get_rect()
+            textRect.center = (300, 25)
+            self.screen.blit(text, textRect)
+            self.drawn_header = header
+            self.dirty.append(rect)
 
-        pygame.display.update()
+    def wait(self, milliseconds):
+        self.present()
+        pygame.time.wait(milliseconds)
 
     def print_winner(self, winner, table=True):
         if winner == 1:
@@ -1,15 +1,123 @@
 from interfaces import TextInterface, GUI
-from players import HumanPlayer, RandomBot, SmartBot
-from errors import ModeNotExist
+from players import HumanPlayer, RandomBot, SmartBot, AlphaBetaBot
+from errors import ModeNotExist, WrongPawn, WrongTarget, GameOver
+from transposition import ZOBRIST, ZOBRIST_MIRRORED, zobrist_hash
+from profiling import Profiler
 
 from random import choice
 from colorama import init as colorinit
-from os import system, name
 
-import pygame
 import sys
 
 
+# Board geometry
+CELLS = [(row, column) for row in range(5) for column in range(5)]
+DIRECTIONS = [(x, y) for x in range(-1, 2) for y in range(-1, 2) if (x, y) != (0, 0)]
+
+
+def build_rays():
+    """
+    Returns list of rays for every cell of the board.
+    rays[cell][direction] is tuple of cell indices (row * 5 + column) along DIRECTIONS[direction],
+    starting from nearest one.
+    """
+    rays = []
+    for row, column in CELLS:
+        cell_rays = []
+        for vector_row, vector_column in DIRECTIONS:
+            ray = []
+            ray_row, ray_column = row + vector_row, column + vector_column
+            while 0 <= ray_row <= 4 and 0 <= ray_column <= 4:
+                ray.append(ray_row * 5 + ray_column)
+                ray_row, ray_column = ray_row + vector_row, ray_column + vector_column
+            cell_rays.append(tuple(ray))
+        rays.append(tuple(cell_rays))
+    return tuple(rays)
+
+
+RAYS = build_rays()
+NEIGHBOURS = tuple(sum(1 << ray[0] for ray in cell_rays if ray) for cell_rays in RAYS)
+
+
+def generate_slides(occupied, pawns):
+    """
+    Yields all encoded slides of given pawns.
+
+    :param occupied: Mask of occupied cells
+    :type occupied: int
+
+    :param pawns: Mask of pawns that can be moved
+    :type pawns: int
+    """
+    while pawns:
+        bit = pawns & -pawns
+        pawns ^= bit
+        origin = bit.bit_length() - 1
+        for ray in RAYS[origin]:
+            target = -1
+            for cell in ray:
+                if occupied >> cell & 1:
+                    break
+                target = cell
+            if target >= 0:
+                yield origin * 25 + target
+
+
+# Moves
+# Slide of pawn is encoded as origin * 25 + target, where cell is row * 5 + column.
+# Full turn (neutron slide and pawn slide) is encoded as neutron_slide << 10 | pawn_slide.
+# Slide 0 (from cell 0 to cell 0) means no slide, e.g. neutron part of first turn.
+NO_SLIDE = 0
+
+
+def encode_slide(origin_coordinates, target_coordinates):
+    """
+    Returns slide encoded as integer.
+
+    :param origin_coordinates: Coordinates of moved pawn
+    :type origin_coordinates: tuple of integers
+
+    :param target_coordinates: Coordinates of target
+    :type target_coordinates: tuple of integers
+    """
+    origin_row, origin_column = origin_coordinates
+    target_row, target_column = target_coordinates
+    return (origin_row * 5 + origin_column) * 25 + target_row * 5 + target_column
+
+
+def decode_slide(slide):
+    """
+    Returns origin and target coordinates of encoded slide.
+
+    :param slide: Encoded slide
+    :type slide: int
+    """
+    return CELLS[slide // 25], CELLS[slide % 25]
+
+
+def encode_turn(neutron_slide, pawn_slide):
+    """
+    Returns full turn encoded as integer.
+
+    :param neutron_slide: Encoded slide of neutron (NO_SLIDE if neutron doesn't move)
+    :type neutron_slide: int
+
+    :param pawn_slide: Encoded slide of pawn (NO_SLIDE if game ended after neutron slide)
+    :type pawn_slide: int
+    """
+    return neutron_slide << 10 | pawn_slide
+
+
+def decode_turn(turn):
+    """
+    Returns neutron slide and pawn slide of encoded turn.
+
+    :param turn: Encoded turn
+    :type turn: int
+    """
+    return turn >> 10, turn & 1023
+
+
 # Board
 class Board:
     """
@@ -20,10 +128,13 @@ class Board:
         :param custom: Custom board to replace standard board.
         :type custom: list of lists
         """
+        self.history = []
+        self.clear_moves_cache()
         if custom is None:
             self.reset_board()
         else:
             self.board = custom
+            self.index_pawns()
 
     def reset_board(self):
         """
@@ -33,6 +144,29 @@ class Board:
         self.board[0] = [2, 2, 2, 2, 2]
         self.board[2] = [0, 0, 3, 0, 0]
         self.board[4] = [1, 1, 1, 1, 1]
+        self.index_pawns()
+        self.history = []
+
+    def index_pawns(self):
+        """
+        Builds index of pawns: dictionary of sets of coordinates by id.
+        Index is kept up to date by replace().
+        """
+        self.clear_moves_cache()
+        self.pawns = {0: set(), 1: set(), 2: set(), 3: set()}
+        for row in range(len(self.board)):
+            for column in range(len(self.board[row])):
+                self.pawns.setdefault(self.board[row][column], set()).add((row, column))
+        self.hash = zobrist_hash(self.board)
+        self.mirror_hash = zobrist_hash(self.board, ZOBRIST_MIRRORED)
+
+    def clear_moves_cache(self):
+        """
+        Removes moves cached for the current position (targets of pawns and possible pawns of players).
+        Called whenever the board changes.
+        """
+        self.paths_cache = {}
+        self.pawns_cache = {}
 
     def replace(self, origin_coordinates, target_coordinates):
         """
@@ -47,10 +181,62 @@ class Board:
         """
         origin_row, origin_column = origin_coordinates
         target_row, target_column = target_coordinates
+        self.paths_cache.clear()
+        self.pawns_cache.clear()
+
+        origin_cell = origin_row * 5 + origin_column
+        target_cell = target_row * 5 + target_column
+
+        self.pawns[self.board[target_row][target_column]].discard((target_row, target_column))
+        self.pawns[self.board[origin_row][origin_column]].discard((origin_row, origin_column))
+        self.hash ^= ZOBRIST[self.board[target_row][target_column]][target_cell]
+        self.mirror_hash ^= ZOBRIST_MIRRORED[self.board[target_row][target_column]][target_cell]
+        if origin_cell != target_cell:
+            self.hash ^= ZOBRIST[self.board[origin_row][origin_column]][origin_cell]
+            self.mirror_hash ^= ZOBRIST_MIRRORED[self.board[origin_row][origin_column]][origin_cell]
 
         self.board[target_row][target_column] = self.board[origin_row][origin_column]
         self.board[origin_row][origin_column] = 0
 
+        self.pawns[self.board[target_row][target_column]].add((target_row, target_column))
+        self.pawns[0].add((origin_row, origin_column))
+        self.hash ^= ZOBRIST[self.board[target_row][target_column]][target_cell]
+        self.mirror_hash ^= ZOBRIST_MIRRORED[self.board[target_row][target_column]][target_cell]
+
+    def slide(self, slide):
+        """
+        Moves pawn according to encoded slide, does nothing for NO_SLIDE.
+
+        :param slide: Encoded slide
+        :type slide: int
+        """
+        if slide != NO_SLIDE:
+            self.replace(CELLS[slide // 25], CELLS[slide % 25])
+
+    def make_move(self, turn):
+        """
+        Makes full turn (neutron slide and pawn slide) and pushes it on undo stack.
+        Turn has to be legal (targets have to be empty).
+
+        :param turn: Encoded turn
+        :type turn: int
+        """
+        self.slide(turn >> 10)
+        self.slide(turn & 1023)
+        self.history.append(turn)
+
+    def unmake_move(self):
+        """
+        Takes back last turn made by make_move(). Returns this turn.
+        """
+        turn = self.history.pop()
+        neutron_slide, pawn_slide = turn >> 10, turn & 1023
+        if pawn_slide != NO_SLIDE:
+            self.slide(pawn_slide % 25 * 25 + pawn_slide // 25)
+        if neutron_slide != NO_SLIDE:
+            self.slide(neutron_slide % 25 * 25 + neutron_slide // 25)
+        return turn
+
     def validate_coordinates(self, coordinates):
         """
         Checks if coordinates are valid. Returns bool.
@@ -73,25 +259,125 @@ class Board:
         :param id: id of pawns you are searching for
         :type id: int
         """
-        coordinates = []
-        for row in range(0, len(self.board)):
-            for column in range(0, len(self.board[row])):
-                if self.board[row][column] == id:
-                    coordinates.append((row, column))
-        return coordinates
+        return sorted(self.pawns.get(id, ()))
+
+    def get_mask(self, id):
+        """
+        Returns mask of cells (bit row * 5 + column) of all pawns with given id.
+
+        :param id: id of pawns you are searching for
+        :type id: int
+        """
+        mask = 0
+        for row, column in self.pawns.get(id, ()):
+            mask |= 1 << (row * 5 + column)
+        return mask
+
+    def get_occupied(self):
+        """
+        Returns mask of all occupied cells.
+        """
+        return self.get_mask(1) | self.get_mask(2) | self.get_mask(3)
+
+    def generate_turns(self, player_id, neutron=True):
+        """
+        Yields all legal turns of player as encoded turns (see encode_turn()).
+        If neutron slide ends the game or player can't move any pawn after it (draw), turn has only neutron slide
+        (see get_turn_winner()).
+
+        :param player_id: id of player
+        :type player_id: int
+
+        :param neutron: False if turn has no neutron slide (first turn of the game)
+        :type neutron: bool
+        """
+        occupied = self.get_occupied()
+        pawns = self.get_mask(player_id)
+        if not neutron:
+            yield from generate_slides(occupied, pawns)
+            return
+
+        neutron_row, neutron_column = self.get_neutron()
+        origin = neutron_row * 5 + neutron_column
+        for ray in RAYS[origin]:
+            target = -1
+            for cell in ray:
+                if occupied >> cell & 1:
+                    break
+                target = cell
+            if target < 0:
+                continue
+
+            neutron_turn = (origin * 25 + target) << 10
+            moved = occupied ^ (1 << origin | 1 << target)
+            if target < 5 or target >= 20 or moved & NEIGHBOURS[target] == NEIGHBOURS[target]:
+                yield neutron_turn
+            else:
+                blocked = True
+                for slide in generate_slides(moved, pawns):
+                    blocked = False
+                    yield neutron_turn | slide
+                if blocked:
+                    yield neutron_turn
+
+    def get_winner(self):
+        """
+        Returns id of the winner of the game (3 for draw) or None if game is not finished.
+        """
+        neutron_row, neutron_column = self.get_neutron()
+        if neutron_row == 0:
+            return 2
+        elif neutron_row == 4:
+            return 1
+        elif self.get_occupied() & NEIGHBOURS[neutron_row * 5 + neutron_column] == NEIGHBOURS[neutron_row * 5 + neutron_column]:
+            return 3
+        else:
+            return None
+
+    def get_neutron_winner(self, player):
+        """
+        Returns id of the winner after neutron slide of player (3 for draw) or None if player continues with pawn slide.
+        Player who can't move any pawn after neutron slide draws.
+
+        :param player: Player who moved neutron.
+        :type player: Player
+        """
+        winner = self.get_winner()
+        if winner is None and self.get_possible_pawns(player) == []:
+            return 3
+        return winner
+
+    def get_turn_winner(self, turn):
+        """
+        Returns id of the winner after encoded turn made by make_move() (3 for draw) or None if game is not finished.
+        Turn without pawn slide that doesn't end the game left player without any pawn move, so it is a draw.
+
+        :param turn: Encoded turn from generate_turns()
+        :type turn: int
+        """
+        winner = self.get_winner()
+        if winner is None and turn & 1023 == NO_SLIDE:
+            return 3
+        return winner
 
     def get_possible_pawns(self, player):
         """
         Return all pawns that player can move.
+        Result is cached until the board changes, returned list must not be modified.
 
         :param player: Player that moves pawns in this moment.
         :type player: Player
         """
+        if player.id in self.pawns_cache:
+            return self.pawns_cache[player.id]
+
         _pawns = []
         for _pawn in self.get_pawns_by_id(player.id):
             if self.get_all_max_paths(_pawn) != []:
                 _pawns.append(_pawn)
-        return sorted(_pawns)
+        _pawns.sort()
+        self.pawns_cache[player.id] = _pawns
+        return _pawns
 
     def get_board(self):
         """
@@ -114,21 +400,29 @@ class Board:
         """
         Returns coordinates of neutron.
         """
-        return self.get_pawns_by_id(3)[0]
+        for neutron in self.pawns[3]:
+            return neutron
 
     def get_all_max_paths(self, origin_coordinates):
         """
         Returns all possible targets for pawn on given coordinates.
+        Result is cached until the board changes, returned list must not be modified.
 
         :param tuple of integers origin_coordinates: Coordinates of pawn.
         :type origin_coordinates: tuple of integers
         """
+        origin_coordinates = tuple(origin_coordinates)
+        if origin_coordinates in self.paths_cache:
+            return self.paths_cache[origin_coordinates]
+
         _paths = []
         for vector in [(x, y) for x in range(-1, 2) for y in range(-1, 2)]:
             if self.get_max_directed_path((origin_coordinates), vector) != origin_coordinates:
                 if self.get_max_directed_path((origin_coordinates), vector) not in _paths:
                     _paths.append(self.get_max_directed_path((origin_coordinates), vector))
-        return sorted(_paths)
+        _paths.sort()
+        self.paths_cache[origin_coordinates] = _paths
+        return _paths
 
     def get_max_directed_path(self, origin_coordinates, vector):
         """
@@ -151,10 +445,224 @@ class Board:
             return self.get_max_directed_path((origin_row + vector_row, origin_column + vector_column), vector)
 
 
+class BitBoard(Board):
+    """
+    Board keeping every type of pawn as 25-bit integer mask (bit row * 5 + column).
+    Paths are read from precomputed RAYS instead of walking the board cell by cell.
+    """
+    @property
+    def board(self):
+        """
+        Board as list of lists (built on every access).
+        """
+        return [[self.get_pawn((row, column)) for column in range(5)] for row in range(5)]
+
+    @board.setter
+    def board(self, board):
+        self.masks = [0, 0, 0, 0]
+        for row in range(5):
+            for column in range(5):
+                if board[row][column] != 0:
+                    self.masks[board[row][column]] |= 1 << (row * 5 + column)
+        self.hash = zobrist_hash(board)
+        self.mirror_hash = zobrist_hash(board, ZOBRIST_MIRRORED)
+        self.clear_moves_cache()
+
+    def reset_board(self):
+        """
+        Resets board to starting state.
+        """
+        self.masks = [0, 0b11111 << 20, 0b11111, 1 << 12]
+        self.hash = zobrist_hash(self.board)
+        self.mirror_hash = zobrist_hash(self.board, ZOBRIST_MIRRORED)
+        self.history = []
+        self.clear_moves_cache()
+
+    def replace(self, origin_coordinates, target_coordinates):
+        """
+        Switches place of two elements on the board.
+
+        :param origin_coordinates: Coordinates of first element
+        :type origin_coordinates: tuple of integers
+
+        :param target_coordinates: Coordinates of second element
+        :type target_coordinates: tuple of integers
+
+        """
+        origin_row, origin_column = origin_coordinates
+        target_row, target_column = target_coordinates
+        origin_cell = origin_row * 5 + origin_column
+        target_cell = target_row * 5 + target_column
+        origin_bit = 1 << origin_cell
+        target_bit = 1 << target_cell
+        self.paths_cache.clear()
+        self.pawns_cache.clear()
+
+        id = self.get_pawn(origin_coordinates)
+        self.hash ^= ZOBRIST[self.get_pawn(target_coordinates)][target_cell]
+        self.mirror_hash ^= ZOBRIST_MIRRORED[self.get_pawn(target_coordinates)][target_cell]
+        if origin_cell != target_cell:
+            self.hash ^= ZOBRIST[id][origin_cell] ^ ZOBRIST[id][target_cell]
+            self.mirror_hash ^= ZOBRIST_MIRRORED[id][origin_cell] ^ ZOBRIST_MIRRORED[id][target_cell]
+        masks = self.masks
+        masks[1] &= ~target_bit
+        masks[2] &= ~target_bit
+        masks[3] &= ~target_bit
+        if id != 0:
+            masks[id] |= target_bit
+            masks[id] &= ~origin_bit
+
+    def index_pawns(self):
+        """
+        Masks are the index of pawns, nothing to build.
+        """
+        pass
+
+    def slide(self, slide):
+        """
+        Moves pawn according to encoded slide, does nothing for NO_SLIDE.
+        Target has to be empty.
+
+        :param slide: Encoded slide
+        :type slide: int
+        """
+        if slide != NO_SLIDE:
+            origin = slide // 25
+            target = slide % 25
+            origin_bit = 1 << origin
+            masks = self.masks
+            self.paths_cache.clear()
+            self.pawns_cache.clear()
+            for id in (1, 2, 3):
+                if masks[id] & origin_bit:
+                    masks[id] ^= origin_bit | 1 << target
+                    self.hash ^= ZOBRIST[id][origin] ^ ZOBRIST[id][target]
+                    self.mirror_hash ^= ZOBRIST_MIRRORED[id][origin] ^ ZOBRIST_MIRRORED[id][target]
+                    return
+
+    def get_mask(self, id):
+        """
+        Returns mask of cells (bit row * 5 + column) of all pawns with given id.
+
+        :param id: id of pawns you are searching for
+        :type id: int
+        """
+        if id == 0:
+            return ~self.get_occupied() & 0x1FFFFFF
+        return self.masks[id]
+
+    def get_occupied(self):
+        """
+        Returns mask of all occupied cells.
+        """
+        return self.masks[1] | self.masks[2] | self.masks[3]
+
+    def get_pawns_by_id(self, id):
+        """
+        Returns coordinates of all pawns with given id.
+
+        :param id: id of pawns you are searching for
+        :type id: int
+        """
+        mask = self.get_mask(id)
+        return [CELLS[cell] for cell in range(25) if mask >> cell & 1]
+
+    def get_board(self):
+        """
+        Returns board (list of lists).
+        """
+        return self.board
+
+    def get_pawn(self, coordinates):
+        """
+        Returns id of the element with given coordinates.
+
+        :param coordinates tuple of integers: coordinates of element
+        :type coordinates: tuple of integers
+        """
+        _row, _column = coordinates
+        _cell = _row * 5 + _column
+
+        if self.masks[1] >> _cell & 1:
+            return 1
+        if self.masks[2] >> _cell & 1:
+            return 2
+        if self.masks[3] >> _cell & 1:
+            return 3
+        return 0
+
+    def get_neutron(self):
+        """
+        Returns coordinates of neutron.
+        """
+        return CELLS[self.masks[3].bit_length() - 1]
+
+    def get_all_max_paths(self, origin_coordinates):
+        """
+        Returns all possible targets for pawn on given coordinates.
+        Result is cached until the board changes, returned list must not be modified.
+
+        :param tuple of integers origin_coordinates: Coordinates of pawn.
+        :type origin_coordinates: tuple of integers
+        """
+        origin_coordinates = tuple(origin_coordinates)
+        if origin_coordinates in self.paths_cache:
+            return self.paths_cache[origin_coordinates]
+
+        origin_row, origin_column = origin_coordinates
+        occupied = self.get_occupied()
+
+        _paths = []
+        for ray in RAYS[origin_row * 5 + origin_column]:
+            target = None
+            for cell in ray:
+                if occupied >> cell & 1:
+                    break
+                target = cell
+            if target is not None:
+                _paths.append(target)
+        _paths.sort()
+        _paths = [CELLS[cell] for cell in _paths]
+        self.paths_cache[origin_coordinates] = _paths
+        return _paths
+
+    def get_max_directed_path(self, origin_coordinates, vector):
+        """
+        Returns final coordinates of path along vector from given coordinates.
+
+        :param tuple of integers origin_coordinates: coordinates of pawn.
+        :type origin_coordinates: tuple of integers
+
+        :param tuple of integers vector: path vector.
+        :type vector: tuple of integers
+        """
+        if vector not in DIRECTIONS:
+            return origin_coordinates
+        origin_row, origin_column = origin_coordinates
+        occupied = self.get_occupied()
+
+        target = None
+        for cell in RAYS[origin_row * 5 + origin_column][DIRECTIONS.index(vector)]:
+            if occupied >> cell & 1:
+                break
+            target = cell
+        if target is None:
+            return origin_coordinates
+        return CELLS[target]
+
+
 # Game
+# Phases of Game driven by start() and apply(): slide of neutron, slide of pawn or finished game
+NEUTRON_PHASE = "neutron"
+PAWN_PHASE = "pawn"
+END_PHASE = "end"
+
+
 class Game:
-    def __init__(self, video_mode=None, game_mode=None, first_turn=None):
+    def __init__(self, video_mode=None, game_mode=None, first_turn=None, recorder=None, profiler=None):
         self.board = Board()
+        self.recorder = recorder
+        self.profiler = profiler
         self.game_mode = game_mode
         self.video_mode = video_mode
         self.interface = self.set_video_mode(self.board, video_mode)
@@ -165,6 +673,10 @@ class Game:
         else:
             self.first_turn = True
 
+        # State of game driven by start() and apply()
+        self.phase = None
+        self.winner = None
+
     def set_video_mode(self, board, video_mode=None):
         """
         Set video mode to selected, if None sets GUI.
@@ -191,6 +703,8 @@ class Game:
             return [HumanPlayer(1), HumanPlayer(2)]
         elif int(game_mode) == 4:
             return [SmartBot(1), SmartBot(2)]
+        elif int(game_mode) == 5:
+            return [HumanPlayer(1), AlphaBetaBot(2, board_class=BitBoard)]
         else:
             raise ModeNotExist
 
@@ -198,15 +712,95 @@ class Game:
         """
         Returns id of the winner of the game.
         """
-        neutron_row, neutron_column = self.board.get_neutron()
-        if neutron_row == 0:
-            return 2
-        elif neutron_row == 4:
-            return 1
-        elif self.board.get_all_max_paths(self.board.get_neutron()) == []:
-            return 3
+        return self.board.get_winner()
+
+    def start(self, first_player=None):
+        """
+        Starts game from current board without interface, it is then driven by legal_actions() and apply().
+
+        :param first_player: id of player who starts, None chooses random player
+        :type first_player: int
+        """
+        if first_player is None:
+            self.active_player = choice(self.players)
         else:
-            return None
+            self.active_player = self.players[first_player - 1]
+        for player in self.players:
+            player.recorder = self.recorder
+        if self.recorder is not None:
+            self.recorder.start_game(self.players, self.active_player.get_id())
+        self.phase = PAWN_PHASE if self.first_turn else NEUTRON_PHASE
+        self.winner = None
+
+    def legal_actions(self):
+        """
+        Returns all legal actions of active player in current phase as (origin coordinates, target coordinates).
+        """
+        if self.phase == NEUTRON_PHASE:
+            neutron = self.board.get_neutron()
+            return [(neutron, target) for target in self.board.get_all_max_paths(neutron)]
+        elif self.phase == PAWN_PHASE:
+            return [(pawn, target) for pawn in self.board.get_possible_pawns(self.active_player) for target in self.board.get_all_max_paths(pawn)]
+        return []
+
+    def bot_action(self):
+        """
+        Returns action chosen by active player (bot) in current phase.
+        """
+        if self.phase == NEUTRON_PHASE:
+            neutron = self.board.get_neutron()
+            return neutron, self.active_player.get_selected_target(neutron, self.board, None)
+        pawn = self.active_player.get_selected_pawn(self.board, None)
+        return pawn, self.active_player.get_selected_target(pawn, self.board, None)
+
+    def apply(self, action):
+        """
+        Makes one slide of active player and moves game to the next phase.
+        Player who can't move any pawn after neutron slide draws.
+        Returns id of the winner (3 for draw) or None if game isn't finished.
+
+        :param action: Slide as (origin coordinates, target coordinates)
+        :type action: tuple of tuples
+        """
+        if self.phase is None or self.phase == END_PHASE:
+            raise GameOver
+        origin, target = action
+        origin = tuple(origin)
+        target = tuple(target)
+        if self.phase == NEUTRON_PHASE and origin != self.board.get_neutron():
+            raise WrongPawn
+        if self.phase == PAWN_PHASE and origin not in self.board.get_possible_pawns(self.active_player):
+            raise WrongPawn
+        if target not in self.board.get_all_max_paths(origin):
+            raise WrongTarget
+
+        self.active_player.move_pawn(origin, target, self.board)
+        if self.phase == NEUTRON_PHASE:
+            winner = self.board.get_neutron_winner(self.active_player)
+        else:
+            winner = self.get_winner()
+
+        if winner is not None:
+            self.phase = END_PHASE
+            self.winner = winner
+            if self.recorder is not None:
+                self.recorder.end_game(winner)
+        elif self.phase == NEUTRON_PHASE:
+            self.phase = PAWN_PHASE
+        else:
+            self.phase = NEUTRON_PHASE
+            if self.active_player is self.players[0]:
+                self.active_player = self.players[1]
+            else:
+                self.active_player = self.players[0]
+        return winner
+
+    def lap(self, phase=None):
+        """
+        Records time of finished phase of the turn if game has profiler, None starts timing of new turn.
+        """
+        if self.profiler is not None:
+            self.profiler.lap(phase)
 
     def play(self):
         """
@@ -214,11 +808,16 @@ class Game:
         """
         # Initialization
         self.active_player = choice(self.players)
+        for player in self.players:
+            player.recorder = self.recorder
+        if self.recorder is not None:
+            self.recorder.start_game(self.players, self.active_player.get_id())
+        if self.profiler is not None:
+            self.profiler.instrument_game(self)
 
         running = True
         while running:
-            # Beginning of turn
-            system('cls' if name == 'nt' else 'clear')  # Win vs Linux
+            self.lap()
 
             # Neutron turn
             if not self.first_turn:
@@ -228,40 +827,51 @@ class Game:
                     self.interface.print_all_max_paths(neutron)
                 target = self.active_player.get_selected_target(neutron, self.board, self.interface)
                 self.active_player.move_pawn(neutron, target, self.board)
+
+                # Check for win (or draw if player can't move any pawn)
+                winner = self.board.get_neutron_winner(self.active_player)
             else:
                 self.first_turn = False
-
-            # Check for win
-            if self.get_winner() is not None:
-                self.interface.print_winner(self.get_winner())
-                pygame.time.wait(1000)
+                winner = self.get_winner()
+            self.lap("turn.neutron")
+            if winner is not None:
+                if self.recorder is not None:
+                    self.recorder.end_game(winner)
+                self.interface.print_winner(winner)
+                self.interface.wait(1000)
                 if self.game_mode != 4:
-                    return self.interface.select_game_end(self.get_winner())
+                    return self.interface.select_game_end(winner)
                 else:
-                    return self.get_winner()
+                    return winner
 
             # Selecting pawn
             if not self.active_player.is_bot():
                 self.interface.print_header(f"Player's {self.active_player.get_id()} Turn")
                 self.interface.print_possible_pawns(self.active_player)
             pawn = self.active_player.get_selected_pawn(self.board, self.interface)
+            self.lap("turn.select_pawn")
 
             # Selecting pawn's target
             if not self.active_player.is_bot():
                 self.interface.print_all_max_paths(pawn)
             target = self.active_player.get_selected_target(pawn, self.board, self.interface)
+            self.lap("turn.select_target")
 
             # Moving pawns
             self.active_player.move_pawn(pawn, target, self.board)
 
             # Check for win
-            if self.get_winner() is not None:
-                self.interface.print_winner(self.get_winner())
-                pygame.time.wait(1000)
+            winner = self.get_winner()
+            self.lap("turn.move")
+            if winner is not None:
+                if self.recorder is not None:
+                    self.recorder.end_game(winner)
+                self.interface.print_winner(winner)
+                self.interface.wait(1000)
                 if self.game_mode != 4:
-                    return self.interface.select_game_end(self.get_winner())
+                    return self.interface.select_game_end(winner)
                 else:
-                    return self.get_winner()
+                    return winner
             # Ending turn
             if self.players.index(self.active_player) == 0:
                 self.active_player = self.players[1]
@@ -272,21 +882,42 @@ class Game:
 if __name__ == "__main__":
     colorinit()
     print(sys.argv)
+
+    # --profile prints report of calls and phases of turns, --profile=cprofile prints cProfile statistics
+    profile = None
+    for argument in sys.argv[1:]:
+        if argument in ("--profile", "--profile=cprofile"):
+            profile = argument[len("--profile="):] or "report"
+            sys.argv.remove(argument)
+    profiler = Profiler() if profile == "report" else None
+
     try:
         if len(sys.argv) == 1:
-            game = Game(video_mode=0)
+            game = Game(video_mode=0, profiler=profiler)
         elif len(sys.argv) == 2:
-            game = Game(video_mode=sys.argv[1])
+            game = Game(video_mode=sys.argv[1], profiler=profiler)
         elif len(sys.argv) == 3:
-            game = Game(video_mode=sys.argv[1], game_mode=sys.argv[2])
+            game = Game(video_mode=sys.argv[1], game_mode=sys.argv[2], profiler=profiler)
     except ModeNotExist:
         sys.exit("Mode don't exist")
 
-    running = True
-    while running:
-        result = game.play()
-        if result is None:
-            running = False
-        else:
-            game.set_game_mode(game.interface)
-            game.play()
+    if profile == "cprofile":
+        import cProfile
+        import pstats
+        cprofiler = cProfile.Profile()
+        cprofiler.enable()
+    try:
+        running = True
+        while running:
+            result = game.play()
+            if result is None:
+                running = False
+            else:
+                game.set_game_mode(game.interface)
+                game.play()
+    finally:
+        if profile == "cprofile":
+            cprofiler.disable()
+            pstats.Stats(cprofiler).sort_stats("cumulative").print_stats(30)
+        elif profile == "report":
+            print(profiler.report())
@@ -0,0 +1,163 @@
+from main import Board, BitBoard, NO_SLIDE, decode_slide, decode_turn
+from players import Player
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from os import cpu_count
+from time import perf_counter
+
+import argparse
+
+
+def perft(board, player_id, depth, first_turn=False):
+    """
+    Returns number of sequences of depth legal full turns (see Board.generate_turns()) starting with player.
+    Game ends after turn for which board.get_turn_winner() isn't None, so finished games have no further turns.
+
+    :param board: Board, it is restored after counting
+    :type board: Board
+
+    :param player_id: id of player who moves first
+    :type player_id: int
+
+    :param depth: Number of turns
+    :type depth: int
+
+    :param first_turn: True if first turn has no neutron slide (first turn of the game)
+    :type first_turn: bool
+    """
+    if depth == 0:
+        return 1
+    if board.get_winner() is not None:
+        return 0
+    if depth == 1:
+        return sum(1 for turn in board.generate_turns(player_id, not first_turn))
+
+    nodes = 0
+    for turn in list(board.generate_turns(player_id, not first_turn)):
+        board.make_move(turn)
+        if board.get_turn_winner(turn) is None:
+            nodes += perft(board, 3 - player_id, depth - 1)
+        board.unmake_move()
+    return nodes
+
+
+def perft_paths(board, player_id, depth, first_turn=False):
+    """
+    Same as perft(), but turns are made from Board.get_all_max_paths() and Board.get_possible_pawns()
+    like in Game.play(). Used to check these methods against Board.generate_turns().
+    """
+    if depth == 0:
+        return 1
+    if board.get_winner() is not None:
+        return 0
+
+    player = Player(player_id)
+    neutron = board.get_neutron()
+    nodes = 0
+    for neutron_target in [None] if first_turn else list(board.get_all_max_paths(neutron)):
+        if neutron_target is not None:
+            board.replace(neutron, neutron_target)
+        if neutron_target is not None and board.get_neutron_winner(player) is not None:
+            nodes += depth == 1
+        else:
+            for pawn in list(board.get_possible_pawns(player)):
+                for target in list(board.get_all_max_paths(pawn)):
+                    board.replace(pawn, target)
+                    nodes += perft_paths(board, 3 - player_id, depth - 1)
+                    board.replace(target, pawn)
+        if neutron_target is not None:
+            board.replace(neutron_target, neutron)
+    return nodes
+
+
+def perft_turn(rows, player_id, turn, depth, board_class=BitBoard, counter=perft):
+    """
+    Returns number of sequences of depth turns starting with given turn. Used as task of process pool.
+
+    :param rows: Board before the turn
+    :type rows: list of lists
+
+    :param counter: perft() or perft_paths()
+    """
+    board = board_class(custom=[row[:] for row in rows])
+    board.make_move(turn)
+    if board.get_turn_winner(turn) is not None:
+        return 0
+    return counter(board, 3 - player_id, depth - 1)
+
+
+def divide(board, player_id, depth, first_turn=False, workers=None, board_class=BitBoard, counter=perft):
+    """
+    Returns dictionary of number of sequences of depth turns by their first (encoded) turn.
+    Root turns are split between worker processes. Depth has to be at least 1 (there is no first turn otherwise).
+
+    :param workers: Number of worker processes, None uses all cores, 1 counts in this process.
+    :type workers: int
+
+    :param counter: Function counting turns after the first one, perft() or perft_paths()
+    """
+    if depth < 1:
+        raise ValueError("Depth has to be at least 1")
+    if board.get_winner() is not None:
+        return {}
+    turns = list(board.generate_turns(player_id, not first_turn))
+    if depth == 1:
+        return {turn: 1 for turn in turns}
+
+    rows = [row[:] for row in board.get_board()]
+    if workers is None:
+        workers = cpu_count() or 1
+    workers = max(1, min(workers, len(turns)))
+    tasks = [(rows, player_id, turn, depth, board_class, counter) for turn in turns]
+    if workers == 1:
+        counts = [perft_turn(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers, mp_context=get_context("spawn")) as pool:
+            counts = list(pool.map(perft_turn, *zip(*tasks)))
+    return dict(zip(turns, counts))
+
+
+def format_turn(turn):
+    """
+    Returns encoded turn as text, e.g. "(2, 2)-(1, 2) (4, 0)-(1, 0)", "-" for no slide.
+    """
+    return " ".join("-" if slide == NO_SLIDE else "{}-{}".format(*decode_slide(slide)) for slide in decode_turn(turn))
+
+
+def parse_board(text):
+    """
+    Returns board (list of lists) from rows separated by "/", e.g. "22222/00000/00300/00000/11111".
+    """
+    rows = [[int(pawn) for pawn in row] for row in text.split("/")]
+    if len(rows) != 5 or any(len(row) != 5 for row in rows):
+        raise ValueError("Board has to have 5 rows of 5 pawns")
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Counts legal turns to given depth (perft).")
+    parser.add_argument("depth", type=int, help="Number of full turns")
+    parser.add_argument("-b", "--board", type=parse_board, default=None, help="Board as rows separated by / (default: starting position)")
+    parser.add_argument("-p", "--player", type=int, default=1, choices=[1, 2], help="Player who moves first")
+    parser.add_argument("-f", "--first-turn", action="store_true", help="First turn has no neutron slide (start of the game)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Number of worker processes (default: all cores)")
+    parser.add_argument("-d", "--divide", action="store_true", help="Print number of sequences for every first turn")
+    parser.add_argument("--board-class", choices=["Board", "BitBoard"], default="BitBoard", help="Board implementation")
+    parser.add_argument("--paths", action="store_true", help="Count turns made by Board.get_all_max_paths() instead of Board.generate_turns()")
+    args = parser.parse_args()
+    if args.depth < 1:
+        parser.error("depth has to be at least 1")
+
+    board_class = BitBoard if args.board_class == "BitBoard" else Board
+    board = board_class(custom=args.board)
+    start = perf_counter()
+    counter = perft_paths if args.paths else perft
+    counts = divide(board, args.player, args.depth, args.first_turn, args.workers, board_class, counter)
+    seconds = perf_counter() - start
+
+    if args.divide:
+        for turn, count in counts.items():
+            print(f"{format_turn(turn)}: {count}")
+    nodes = sum(counts.values())
+    print(f"perft({args.depth}) = {nodes}")
+    print(f"{seconds:.2f} s ({nodes / seconds if seconds > 0 else float('inf'):.0f} nodes/s)")
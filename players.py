@@ -1,5 +1,11 @@
-from random import choice
-from errors import WrongPawn, WrongData, WrongCoordinates, WrongTarget, BlockedPawn
+from random import choice, Random
+from time import perf_counter
+from math import log, sqrt
+from os import cpu_count
+from errors import WrongPawn, WrongData, WrongCoordinates, WrongTarget, BlockedPawn, SearchTimeout
+from transposition import TranspositionTable, canonical_key, mirror_turn, EXACT, LOWER, UPPER
+
+WIN = 1000
 
 
 class Player:
@@ -7,6 +13,9 @@ class Player:
     Main class describing player in the game.
     :params id: ID of the Player (Position on board 1-Bottom, 2-Top).
     """
+    # Object recording moves (e.g. records.RecordWriter), None if moves aren't recorded
+    recorder = None
+
     def __init__(self, id):
         self.id = id
         self.bot = True
@@ -19,9 +28,11 @@ class Player:
 
     def move_pawn(self, origin_coordinates, target_coordinates, board):
         """
-        Moves pawn on the board using board.replace().
+        Moves pawn on the board using board.replace() and records the move if player has recorder.
         """
         board.replace(origin_coordinates, target_coordinates)
+        if self.recorder is not None:
+            self.recorder.record(origin_coordinates, target_coordinates)
 
 
 class HumanPlayer(Player):
@@ -193,3 +204,456 @@ class SmartBot(Player):
             return choice(secondary_targets)
         else:
             return choice(tertiary_targets)
+
+
+class SearchBot(Player):
+    """
+    Base class of bots that choose whole turn (neutron slide and pawn slide) at once.
+    Subclasses implement search(board, neutron=True) returning encoded turn (see Board.generate_turns())
+    or None if player can't move, where neutron is False for turn without neutron slide (first turn of the game).
+    """
+    def __init__(self, id):
+        self.id = id
+        self.bot = True
+        self.planned_slide = None
+
+    def get_selected_pawn(self, board, interface):
+        """
+        Returns coordinates of pawn from planned turn.
+        Without planned turn (first turn of the game) searches turn without neutron slide.
+        """
+        if self.planned_slide is None:
+            turn = self.search(board, neutron=False)
+            if turn is None:
+                return choice(board.get_possible_pawns(self))
+            self.planned_slide = turn & 1023
+        return divmod(self.planned_slide // 25, 5)
+
+    def get_selected_target(self, pawn, board, interface):
+        """
+        Neutron: searches best turn, plans its pawn slide and returns neutron target.
+        Pawns: returns target from planned turn.
+        """
+        if pawn == board.get_neutron():
+            turn = self.search(board)
+            if turn is None:
+                return choice(board.get_all_max_paths(pawn))
+            self.planned_slide = turn & 1023 or None
+            return divmod((turn >> 10) % 25, 5)
+
+        if self.planned_slide is None or divmod(self.planned_slide // 25, 5) != tuple(pawn):
+            return choice(board.get_all_max_paths(pawn))
+        target = divmod(self.planned_slide % 25, 5)
+        self.planned_slide = None
+        return target
+
+
+class AlphaBetaBot(SearchBot):
+    """
+    Main class describing search bot in the game.
+    It searches full turns (neutron slide and pawn slide) using negamax with alpha-beta pruning
+    and iterative deepening, and plays best turn found before time limit runs out.
+    :params time_limit: Time for one move in seconds.
+    :params max_depth: Maximal depth of search in full turns.
+    :params board_class: Board class used for search (e.g. BitBoard), None searches on game board.
+    :params table: TranspositionTable used for search, None creates new one.
+    """
+    def __init__(self, id, time_limit=1.0, max_depth=32, board_class=None, table=None):
+        super().__init__(id)
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.board_class = board_class
+        if table is None:
+            table = TranspositionTable()
+        self.table = table
+        self.nodes = 0
+
+    def search(self, board, neutron=True):
+        """
+        Returns best encoded turn found in time limit or None if player can't move.
+
+        :param neutron: False if turn has no neutron slide (first turn of the game)
+        :type neutron: bool
+        """
+        if self.board_class is not None:
+            board = self.board_class(custom=[row[:] for row in board.get_board()])
+        self.deadline = perf_counter() + self.time_limit
+        self.nodes = 0
+        self.table.new_search()
+
+        turns = list(board.generate_turns(self.id, neutron))
+        if turns == []:
+            return None
+
+        history = len(board.history)
+        best_turn = turns[0]
+        for depth in range(1, self.max_depth + 1):
+            try:
+                score, turn = self.search_root(board, turns, depth)
+            except SearchTimeout:
+                while len(board.history) > history:
+                    board.unmake_move()
+                break
+            best_turn = turn
+            turns.remove(turn)
+            turns.insert(0, turn)
+            if abs(score) >= WIN - self.max_depth - 1:
+                break
+        return best_turn
+
+    def search_root(self, board, turns, depth):
+        """
+        Searches all root turns to given depth. Returns best score and turn.
+        """
+        alpha = -WIN - 1
+        best_turn = turns[0]
+        for turn in turns:
+            board.make_move(turn)
+            score = -self.negamax(board, 3 - self.id, depth - 1, -WIN - 1, -alpha, 1)
+            board.unmake_move()
+            if score > alpha:
+                alpha = score
+                best_turn = turn
+        return alpha, best_turn
+
+    def negamax(self, board, player_id, depth, alpha, beta, ply):
+        """
+        Returns score of the position from the view of player who moves.
+        Raises SearchTimeout when time limit runs out.
+        """
+        self.nodes += 1
+        winner = board.get_turn_winner(board.history[-1])
+        if winner is not None:
+            if winner == 3:
+                return 0
+            return WIN - ply if winner == player_id else ply - WIN
+        if depth == 0:
+            return self.evaluate(board, player_id, ply)
+        if perf_counter() > self.deadline:
+            raise SearchTimeout
+
+        # Transposition table (mate scores are stored relative to the position)
+        # Mirrored positions share entry, turns are stored for the canonical one
+        key, mirrored = canonical_key(board, player_id)
+        entry = self.table.probe(key)
+        table_turn = 0
+        if entry is not None:
+            entry_depth, flag, score, table_turn = entry
+            if mirrored:
+                table_turn = mirror_turn(table_turn)
+            if score > WIN - 256:
+                score -= ply
+            elif score < 256 - WIN:
+                score += ply
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return score
+                if flag == LOWER and score >= beta:
+                    return score
+                if flag == UPPER and score <= alpha:
+                    return score
+
+        original_alpha = alpha
+        best = None
+        best_turn = 0
+        for turn in self.order_turns(board, player_id, table_turn):
+            board.make_move(turn)
+            score = -self.negamax(board, 3 - player_id, depth - 1, -beta, -alpha, ply + 1)
+            board.unmake_move()
+            if best is None or score > best:
+                best = score
+                best_turn = turn
+                if best > alpha:
+                    alpha = best
+                    if alpha >= beta:
+                        break
+        if best is None:
+            return 0
+
+        if best <= original_alpha:
+            flag = UPPER
+        elif best >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        score = best
+        if score > WIN - 256:
+            score += ply
+        elif score < 256 - WIN:
+            score -= ply
+        self.table.store(key, depth, flag, score, mirror_turn(best_turn) if mirrored else best_turn)
+        return best
+
+    def order_turns(self, board, player_id, first_turn):
+        """
+        Yields legal turns starting with given turn (e.g. best turn from transposition table).
+        """
+        if first_turn:
+            yield first_turn
+        for turn in board.generate_turns(player_id):
+            if turn != first_turn:
+                yield turn
+
+    def evaluate(self, board, player_id, ply):
+        """
+        Returns heuristic score of the position from the view of player who moves:
+        Neutron that can reach home row is a win, neutron that can reach only enemy home row is a loss.
+        Otherwise neutron close to home row and with many safe targets is better.
+        """
+        if player_id == 1:
+            enemy_row = 0
+            home_row = 4
+        else:
+            enemy_row = 4
+            home_row = 0
+
+        neutron_row, neutron_column = board.get_neutron()
+        safe_targets = 0
+        for row, column in board.get_all_max_paths((neutron_row, neutron_column)):
+            if row == home_row:
+                return WIN - ply - 1
+            if row != enemy_row:
+                safe_targets += 1
+        if safe_targets == 0:
+            return ply + 1 - WIN
+        return safe_targets + 3 * (4 - abs(home_row - neutron_row))
+
+
+class TablebaseBot(AlphaBetaBot):
+    """
+    Search bot playing perfect turns from tablebase (see tablebase.py) in positions it contains
+    and searching other positions like AlphaBetaBot.
+    It is an analysis tool for reduced variants (boards with fewer pawns of every player): pawns never leave
+    the board, so standard game (5 pawns) never reaches solvable positions and bot only searches like AlphaBetaBot.
+    :params tablebase: Opened tablebase.Tablebase.
+    """
+    def __init__(self, id, tablebase, **options):
+        super().__init__(id, **options)
+        self.tablebase = tablebase
+
+    def search(self, board, neutron=True):
+        """
+        Returns turn from tablebase or best encoded turn found by search, None if player can't move.
+
+        :param neutron: False if turn has no neutron slide (first turn of the game)
+        :type neutron: bool
+        """
+        if neutron:
+            turn = self.tablebase.best_turn(board, self.id)
+            if turn is not None:
+                return turn
+        return super().search(board, neutron)
+
+
+class BookBot(AlphaBetaBot):
+    """
+    Search bot playing openings from opening book (see book.py) and searching other positions like AlphaBetaBot.
+    :params book: Opened book.OpeningBook.
+    :params min_games: Minimal number of games of turn from the book.
+    """
+    def __init__(self, id, book, min_games=5, **options):
+        super().__init__(id, **options)
+        self.book = book
+        self.min_games = min_games
+
+    def search(self, board, neutron=True):
+        """
+        Returns turn from the book or best encoded turn found by search, None if player can't move.
+
+        :param neutron: False if turn has no neutron slide (first turn of the game)
+        :type neutron: bool
+        """
+        turn = self.book.best_turn(board, self.id, neutron, self.min_games)
+        if turn is not None:
+            return turn
+        return super().search(board, neutron)
+
+
+class MCTSNode:
+    """
+    Node of Monte Carlo search tree.
+    :params turn: Encoded turn that leads to this node.
+    :params player_id: id of player who moves in this node.
+    :params turns: Legal turns from this node.
+    """
+    def __init__(self, parent, turn, player_id, turns):
+        self.parent = parent
+        self.turn = turn
+        self.player_id = player_id
+        self.untried_turns = turns
+        self.children = []
+        self.visits = 0
+        self.wins = 0.0
+
+    def select_child(self, exploration):
+        """
+        Returns child with the best UCT score.
+        """
+        log_visits = log(self.visits)
+        best = None
+        best_score = None
+        for child in self.children:
+            score = child.wins / child.visits + exploration * sqrt(log_visits / child.visits)
+            if best is None or score > best_score:
+                best = child
+                best_score = score
+        return best
+
+
+def random_playout(board, player_id, max_turns=200):
+    """
+    Plays the game from given position with RandomBot policy and takes all moves back.
+    Returns id of the winner (3 for draw).
+
+    :param player_id: id of player who moves neutron now
+    :type player_id: int
+    """
+    bots = [None, RandomBot(1), RandomBot(2)]
+    moves = []
+    winner = board.get_winner()
+    for turn in range(max_turns):
+        if winner is not None:
+            break
+        bot = bots[player_id]
+
+        neutron = board.get_neutron()
+        target = bot.get_selected_target(neutron, board, None)
+        board.replace(neutron, target)
+        moves.append((neutron, target))
+        winner = board.get_neutron_winner(bot)
+        if winner is not None:
+            break
+
+        pawn = bot.get_selected_pawn(board, None)
+        target = bot.get_selected_target(pawn, board, None)
+        board.replace(pawn, target)
+        moves.append((pawn, target))
+        winner = board.get_winner()
+        player_id = 3 - player_id
+
+    for origin, target in reversed(moves):
+        board.replace(target, origin)
+    if winner is None:
+        return 3
+    return winner
+
+
+def mcts_worker(board_class, board, player_id, neutron, playouts, time_limit, exploration, seed):
+    """
+    Runs UCT search from given position. Returns statistics of root turns: dictionary turn: (visits, wins).
+    Used as task of process pool, so arguments are plain data.
+
+    :param board: Board
+    :type board: list of lists
+    """
+    board = board_class(custom=board)
+    rng = Random(seed)
+    deadline = perf_counter() + time_limit
+
+    root = MCTSNode(None, 0, player_id, list(board.generate_turns(player_id, neutron)))
+    for playout in range(playouts):
+        if perf_counter() > deadline:
+            break
+
+        # Selection
+        node = root
+        depth = 0
+        while node.untried_turns == [] and node.children != []:
+            node = node.select_child(exploration)
+            board.make_move(node.turn)
+            depth += 1
+
+        # Expansion
+        if node.untried_turns != []:
+            turn = node.untried_turns.pop(rng.randrange(len(node.untried_turns)))
+            board.make_move(turn)
+            depth += 1
+            if board.get_turn_winner(turn) is None:
+                turns = list(board.generate_turns(3 - node.player_id))
+            else:
+                turns = []
+            child = MCTSNode(node, turn, 3 - node.player_id, turns)
+            node.children.append(child)
+            node = child
+
+        # Simulation
+        winner = None
+        if node is not root:
+            winner = board.get_turn_winner(node.turn)
+        if winner is None:
+            winner = random_playout(board, node.player_id)
+
+        # Backpropagation
+        while node is not None:
+            node.visits += 1
+            if winner == 3:
+                node.wins += 0.5
+            elif winner != node.player_id:
+                node.wins += 1
+            node = node.parent
+        for move in range(depth):
+            board.unmake_move()
+
+    return {child.turn: (child.visits, child.wins) for child in root.children}
+
+
+class MCTSBot(SearchBot):
+    """
+    Main class describing Monte Carlo Tree Search bot in the game.
+    It searches full turns with UCT and random playouts (RandomBot policy).
+    Every worker process builds its own tree (root parallelism) and statistics of root turns are summed.
+    :params playouts: Number of playouts for one move (split between workers).
+    :params time_limit: Time for one move in seconds.
+    :params workers: Number of worker processes, None uses all cores, 1 searches in this process.
+    :params board_class: Board class used for search (e.g. BitBoard), None uses class of game board.
+    """
+    def __init__(self, id, playouts=1000, time_limit=1.0, workers=None, board_class=None, exploration=1.4):
+        super().__init__(id)
+        self.playouts = playouts
+        self.time_limit = time_limit
+        if workers is None:
+            workers = cpu_count() or 1
+        self.workers = workers
+        self.board_class = board_class
+        self.exploration = exploration
+        self.pool = None
+        self.rng = Random()
+
+    def search(self, board, neutron=True):
+        """
+        Returns most visited encoded turn or None if player can't move.
+
+        :param neutron: False if turn has no neutron slide (first turn of the game)
+        :type neutron: bool
+        """
+        board_class = self.board_class or type(board)
+        playouts = -(-self.playouts // self.workers)
+        tasks = [
+            (board_class, [row[:] for row in board.get_board()], self.id, neutron, playouts, self.time_limit, self.exploration, self.rng.getrandbits(32))
+            for worker in range(self.workers)
+        ]
+        if self.workers == 1:
+            results = [mcts_worker(*tasks[0])]
+        else:
+            if self.pool is None:
+                # Spawned workers don't inherit state of this process (e.g. initialised pygame)
+                from multiprocessing import get_context
+                self.pool = get_context("spawn").Pool(self.workers)
+            results = self.pool.starmap(mcts_worker, tasks)
+
+        statistics = {}
+        for result in results:
+            for turn, (visits, wins) in result.items():
+                total_visits, total_wins = statistics.get(turn, (0, 0.0))
+                statistics[turn] = (total_visits + visits, total_wins + wins)
+        if statistics == {}:
+            return None
+        return max(statistics, key=lambda turn: statistics[turn])
+
+    def close(self):
+        """
+        Stops worker processes.
+        """
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool = None
@@ -0,0 +1,88 @@
+from functools import wraps
+from time import perf_counter
+
+
+# Methods wrapped by Profiler.instrument_game()
+PLAYER_METHODS = ("get_selected_pawn", "get_selected_target")
+BOARD_METHODS = ("get_all_max_paths", "get_possible_pawns", "get_winner")
+INTERFACE_METHODS = ("print_header", "print_background", "print_all_max_paths", "print_possible_pawns", "print_error", "print_winner")
+
+
+class Profiler:
+    """
+    Collects number of calls and wall time of instrumented methods and phases of turns.
+    Objects are instrumented by wrapping their methods (only instances, classes are untouched),
+    so nothing is measured and nothing slows down when profiler isn't used.
+    Times of nested calls (e.g. get_all_max_paths() called by get_possible_pawns()) are included in both.
+    """
+    def __init__(self):
+        # stats[name] is [number of calls, seconds]
+        self.stats = {}
+        self.lap_start = perf_counter()
+
+    def record(self, name, seconds):
+        """
+        Adds one call taking given time.
+        """
+        stat = self.stats.get(name)
+        if stat is None:
+            self.stats[name] = [1, seconds]
+        else:
+            stat[0] += 1
+            stat[1] += seconds
+
+    def lap(self, name=None):
+        """
+        Records time since previous lap as phase with given name, None only starts new lap.
+        """
+        now = perf_counter()
+        if name is not None:
+            self.record(name, now - self.lap_start)
+        self.lap_start = now
+
+    def instrument(self, obj, names, prefix):
+        """
+        Wraps methods of the object, so their calls are recorded as prefix.method. Wrapped methods are not wrapped again.
+
+        :param names: Names of methods, missing ones are skipped
+        :type names: list of str
+        """
+        for name in names:
+            method = getattr(obj, name, None)
+            if method is None or getattr(method, "profiler", None) is self:
+                continue
+            setattr(obj, name, self.wrap(method, f"{prefix}.{name}"))
+
+    def wrap(self, method, name):
+        """
+        Returns function calling method and recording its time.
+        """
+        record = self.record
+
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                record(name, perf_counter() - start)
+        wrapper.profiler = self
+        return wrapper
+
+    def instrument_game(self, game):
+        """
+        Instruments players, board and interface of the game.
+        """
+        for player in game.players:
+            self.instrument(player, PLAYER_METHODS, f"player{player.get_id()}")
+        self.instrument(game.board, BOARD_METHODS, "board")
+        self.instrument(game.interface, INTERFACE_METHODS, "interface")
+
+    def report(self):
+        """
+        Returns report (str) of calls sorted by total time.
+        """
+        lines = [f"{'name':36} {'calls':>8} {'total ms':>11} {'mean us':>11}"]
+        for name, (calls, seconds) in sorted(self.stats.items(), key=lambda item: -item[1][1]):
+            lines.append(f"{name:36} {calls:8} {seconds * 1e3:11.2f} {seconds / calls * 1e6:11.1f}")
+        return "\n".join(lines)
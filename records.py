@@ -0,0 +1,153 @@
+from main import Board, CELLS, DIRECTIONS, RAYS
+from struct import Struct
+
+
+# Record format
+# Game is stored as header followed by one byte for every slide (neutron and pawn slides in order of play).
+# Slide always goes to the end of the path, so it is stored as origin * 8 + direction (see DIRECTIONS)
+# and target is found again while replaying. Games are simply appended one after another.
+RECORD_MAGIC = b"NR"
+RECORD_VERSION = 1
+# magic, version, player 1 type, player 2 type, first player, winner (0 if unknown), number of slides
+RECORD_HEADER = Struct("<2sBBBBBH")
+PLAYER_TYPES = ("Player", "HumanPlayer", "RandomBot", "SmartBot", "AlphaBetaBot", "MCTSBot", "TablebaseBot", "BookBot")
+UNKNOWN_PLAYER = 255
+
+
+def encode_record_slide(origin_coordinates, target_coordinates):
+    """
+    Returns slide encoded as one byte (int).
+
+    :param origin_coordinates: Coordinates of moved pawn
+    :type origin_coordinates: tuple of integers
+
+    :param target_coordinates: Coordinates of target at the end of the path
+    :type target_coordinates: tuple of integers
+    """
+    origin_row, origin_column = origin_coordinates
+    target_row, target_column = target_coordinates
+    vector = ((target_row > origin_row) - (target_row < origin_row), (target_column > origin_column) - (target_column < origin_column))
+    return (origin_row * 5 + origin_column) * 8 + DIRECTIONS.index(vector)
+
+
+def decode_record_slide(slide, occupied):
+    """
+    Returns (origin cell, target cell) of slide encoded by encode_record_slide().
+
+    :param slide: Encoded slide
+    :type slide: int
+
+    :param occupied: Mask of occupied cells before the slide
+    :type occupied: int
+    """
+    origin = slide >> 3
+    target = origin
+    for cell in RAYS[origin][slide & 7]:
+        if occupied >> cell & 1:
+            break
+        target = cell
+    return origin, target
+
+
+class GameRecord:
+    """
+    Stored game.
+    :params players: Names of types of players 1 and 2 (None if unknown).
+    :params first_player: id of player who started the game.
+    :params winner: id of the winner (3 for draw), 0 if game wasn't finished.
+    :params slides: Encoded slides (bytes).
+    """
+    def __init__(self, players, first_player, winner, slides):
+        self.players = players
+        self.first_player = first_player
+        self.winner = winner
+        self.slides = slides
+
+    def replay(self, board=None):
+        """
+        Makes slides of the game from starting position on the board using board.replace().
+        Yields (origin coordinates, target coordinates) after every slide.
+
+        :param board: Board with starting position, None creates Board
+        :type board: Board
+        """
+        if board is None:
+            board = Board()
+        occupied = board.get_occupied()
+        for slide in self.slides:
+            origin, target = decode_record_slide(slide, occupied)
+            occupied ^= 1 << origin | 1 << target
+            board.replace(CELLS[origin], CELLS[target])
+            yield CELLS[origin], CELLS[target]
+
+
+class RecordWriter:
+    """
+    Writes played games to binary stream. Slides are recorded by Player.move_pawn()
+    of players with this writer as recorder (see Game.play()), game is written when it ends.
+    :params stream: Binary stream (e.g. file opened with "ab").
+    """
+    def __init__(self, stream):
+        self.stream = stream
+        self.players = (UNKNOWN_PLAYER, UNKNOWN_PLAYER)
+        self.first_player = 0
+        self.slides = bytearray()
+        self.games = 0
+
+    def start_game(self, players, first_player):
+        """
+        Starts recording new game from starting position.
+
+        :param players: Players 1 and 2
+        :type players: list of Player
+
+        :param first_player: id of player who starts
+        :type first_player: int
+        """
+        self.players = tuple(self.get_player_type(player) for player in players)
+        self.first_player = first_player
+        self.slides = bytearray()
+
+    def get_player_type(self, player):
+        """
+        Returns code of player's type stored in header.
+        """
+        name = type(player).__name__
+        if name in PLAYER_TYPES:
+            return PLAYER_TYPES.index(name)
+        return UNKNOWN_PLAYER
+
+    def record(self, origin_coordinates, target_coordinates):
+        """
+        Records slide of current game.
+        """
+        self.slides.append(encode_record_slide(origin_coordinates, target_coordinates))
+
+    def end_game(self, winner):
+        """
+        Writes current game with its winner to the stream.
+        """
+        self.stream.write(RECORD_HEADER.pack(RECORD_MAGIC, RECORD_VERSION, *self.players, self.first_player, winner, len(self.slides)))
+        self.stream.write(self.slides)
+        self.slides = bytearray()
+        self.games += 1
+
+
+def read_records(stream):
+    """
+    Yields all games (GameRecord) stored in binary stream.
+    """
+    while True:
+        header = stream.read(RECORD_HEADER.size)
+        if not header:
+            return
+        if len(header) < RECORD_HEADER.size:
+            raise ValueError("Truncated game record")
+        magic, version, player_1, player_2, first_player, winner, slides = RECORD_HEADER.unpack(header)
+        if magic != RECORD_MAGIC or version != RECORD_VERSION:
+            raise ValueError("Not a game record")
+        players = tuple(PLAYER_TYPES[player] if player < len(PLAYER_TYPES) else None for player in (player_1, player_2))
+        data = stream.read(slides)
+        if len(data) < slides:
+            raise ValueError("Truncated game record")
+        yield GameRecord(players, first_player, winner, data)
@@ -0,0 +1,324 @@
+from main import Game, BitBoard, NEUTRON_PHASE, END_PHASE
+from players import Player, RandomBot, SmartBot, AlphaBetaBot, MCTSBot
+from errors import WrongPawn, WrongTarget, GameOver
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import get_context
+from os import cpu_count
+from time import perf_counter
+
+import argparse
+import asyncio
+
+
+# Protocol
+# Every message is one line of text. Slide is written as "row,column,row,column" (origin and target).
+# Client:
+#   PLAY <bot>         new game against bot from BOT_PLAYERS (e.g. SmartBot), client is player 1
+#   PLAY human         new game against next client waiting for human opponent
+#   MOVE <slide>       slide of the client in its turn
+#   STATS              server statistics
+#   QUIT               ends connection
+# Server:
+#   GAME <game id> <player id>       game started, client plays as player id
+#   BOARD <25 digits>                board row by row after every slide
+#   MOVED <player id> <slide>        slide made by player
+#   TURN <phase> <slide> <slide>...  client moves, phase is neutron or pawn, slides are legal ones
+#   END <winner>                     game ended (3 for draw, 0 if opponent disconnected)
+#   WAIT                             waiting for human opponent
+#   STATS <name>=<value>...          server statistics
+#   ERROR <message>
+# Bots by name, every server worker process already runs one bot turn at a time,
+# so MCTSBot searches in its worker instead of starting its own pool
+BOT_PLAYERS = {
+    "RandomBot": RandomBot,
+    "SmartBot": SmartBot,
+    "AlphaBetaBot": AlphaBetaBot,
+    "MCTSBot": partial(MCTSBot, workers=1, time_limit=1.0),
+}
+
+# Bots of worker process by (class name, id)
+bots = {}
+
+
+def format_slide(slide):
+    (origin_row, origin_column), (target_row, target_column) = slide
+    return f"{origin_row},{origin_column},{target_row},{target_column}"
+
+
+def parse_slide(text):
+    """
+    Returns slide (origin coordinates, target coordinates) or raises ValueError.
+    """
+    values = [int(value) for value in text.split(",")]
+    if len(values) != 4:
+        raise ValueError
+    return (values[0], values[1]), (values[2], values[3])
+
+
+def bot_turn(player_class, player_id, rows, phase):
+    """
+    Returns slides of bot's turn (neutron and pawn slide, or only pawn slide in pawn phase).
+    Runs in worker process, bots are created once for every process.
+
+    :param player_class: Name of bot from BOT_PLAYERS
+    :type player_class: str
+
+    :param rows: Board before the turn
+    :type rows: list of lists
+    """
+    key = (player_class, player_id)
+    if key not in bots:
+        bots[key] = BOT_PLAYERS[player_class](player_id)
+    bot = bots[key]
+    if hasattr(bot, "planned_slide"):
+        bot.planned_slide = None
+
+    board = BitBoard(custom=rows)
+    slides = []
+    if phase == NEUTRON_PHASE:
+        neutron = board.get_neutron()
+        target = bot.get_selected_target(neutron, board, None)
+        board.replace(neutron, target)
+        slides.append((neutron, target))
+        if board.get_neutron_winner(bot) is not None:
+            return slides
+    pawn = bot.get_selected_pawn(board, None)
+    target = bot.get_selected_target(pawn, board, None)
+    slides.append((pawn, target))
+    return slides
+
+
+class Session:
+    """
+    One game hosted by the server.
+    :params id: Id of the game.
+    :params clients: Clients of players 1 and 2, None for bot.
+    :params bot: Name of class of bot player (if any).
+    """
+    def __init__(self, id, clients, bot=None):
+        self.id = id
+        self.clients = clients
+        self.bot = bot
+        self.game = Game(video_mode=1, game_mode=3)
+        if bot is not None:
+            # Bot is created in worker process, game has only placeholder
+            self.game.players[1] = Player(2)
+
+    def get_board(self):
+        board = self.game.board.get_board()
+        return "".join(str(board[row][column]) for row in range(5) for column in range(5))
+
+
+class Client:
+    """
+    Connection of one client.
+    """
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.session = None
+        self.player_id = None
+
+    def send(self, line):
+        self.writer.write(line.encode() + b"\n")
+
+
+class GameServer:
+    """
+    Server hosting many games in one asyncio event loop. Bot turns are computed in worker processes,
+    so the event loop never waits for them.
+    :params workers: Number of worker processes for bots, None uses all cores.
+    """
+    def __init__(self, workers=None):
+        self.workers = workers or cpu_count() or 1
+        self.pool = None
+        self.server = None
+        self.sessions = {}
+        self.waiting = None
+        self.games = 0
+        self.moves = 0
+        # Latencies (seconds) of last moves: from received slide or bot request to sent response
+        self.latencies = deque(maxlen=10000)
+
+    async def start(self, host="127.0.0.1", port=7777):
+        """
+        Starts listening. Returns port (useful when port is 0).
+        """
+        self.pool = ProcessPoolExecutor(self.workers, mp_context=get_context("spawn"))
+        self.server = await asyncio.start_server(self.handle_client, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+        self.pool.shutdown(cancel_futures=True)
+
+    def get_stats(self):
+        """
+        Returns dictionary of server statistics.
+        """
+        latencies = sorted(self.latencies)
+        return {
+            "sessions": len(self.sessions),
+            "sessions_per_core": len(self.sessions) / (cpu_count() or 1),
+            "games": self.games,
+            "moves": self.moves,
+            "latency_ms_mean": sum(latencies) / len(latencies) * 1e3 if latencies else 0.0,
+            "latency_ms_p99": latencies[int(len(latencies) * 0.99)] * 1e3 if latencies else 0.0,
+        }
+
+    def report(self):
+        return " ".join(f"{name}={value:.2f}" if isinstance(value, float) else f"{name}={value}" for name, value in self.get_stats().items())
+
+    async def handle_client(self, reader, writer):
+        client = Client(reader, writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command, _, argument = line.decode().strip().partition(" ")
+                command = command.upper()
+                if command == "QUIT":
+                    break
+                elif command == "PLAY":
+                    await self.play(client, argument.strip())
+                elif command == "MOVE":
+                    await self.move(client, argument.strip())
+                elif command == "STATS":
+                    client.send(f"STATS {self.report()}")
+                else:
+                    client.send("ERROR Unknown command")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.disconnect(client)
+            writer.close()
+
+    async def play(self, client, opponent):
+        if client.session is not None or client is self.waiting:
+            client.send("ERROR Already playing")
+            return
+        if opponent == "human":
+            if self.waiting is None:
+                self.waiting = client
+                client.send("WAIT")
+                return
+            clients = [self.waiting, client]
+            self.waiting = None
+            session = self.create_session(clients)
+        elif opponent in BOT_PLAYERS:
+            session = self.create_session([client, None], opponent)
+        else:
+            client.send("ERROR Unknown opponent")
+            return
+        await self.advance(session)
+
+    def create_session(self, clients, bot=None):
+        self.games += 1
+        session = Session(self.games, clients, bot)
+        self.sessions[session.id] = session
+        for player_id, client in enumerate(clients, 1):
+            if client is not None:
+                client.session = session
+                client.player_id = player_id
+                client.send(f"GAME {session.id} {player_id}")
+                client.send(f"BOARD {session.get_board()}")
+        session.game.start()
+        return session
+
+    async def move(self, client, text):
+        start = perf_counter()
+        session = client.session
+        if session is None:
+            client.send("ERROR Not playing")
+            return
+        game = session.game
+        if game.phase == END_PHASE or session.clients[game.active_player.get_id() - 1] is not client:
+            client.send("ERROR Not your turn")
+            return
+        try:
+            slide = parse_slide(text)
+            self.apply(session, slide)
+        except (ValueError, WrongPawn, WrongTarget, GameOver):
+            client.send("ERROR Illegal slide")
+            return
+        self.latencies.append(perf_counter() - start)
+        await self.advance(session)
+
+    def apply(self, session, slide):
+        """
+        Applies slide of active player and sends it to clients.
+        """
+        player_id = session.game.active_player.get_id()
+        session.game.apply(slide)
+        self.moves += 1
+        for client in session.clients:
+            if client is not None:
+                client.send(f"MOVED {player_id} {format_slide(slide)}")
+                client.send(f"BOARD {session.get_board()}")
+
+    async def advance(self, session):
+        """
+        Plays turns of bots and asks client for its turn or ends the game.
+        """
+        game = session.game
+        loop = asyncio.get_running_loop()
+        while game.phase != END_PHASE and session.clients[game.active_player.get_id() - 1] is None:
+            start = perf_counter()
+            rows = [row[:] for row in game.board.get_board()]
+            slides = await loop.run_in_executor(self.pool, bot_turn, session.bot, game.active_player.get_id(), rows, game.phase)
+            if session.id not in self.sessions:
+                return
+            for slide in slides:
+                self.apply(session, slide)
+            self.latencies.append(perf_counter() - start)
+
+        if game.phase == END_PHASE:
+            self.end_session(session, game.winner)
+        else:
+            client = session.clients[game.active_player.get_id() - 1]
+            client.send(f"TURN {game.phase} " + " ".join(format_slide(slide) for slide in game.legal_actions()))
+
+    def end_session(self, session, winner):
+        self.sessions.pop(session.id, None)
+        for client in session.clients:
+            if client is not None and client.session is session:
+                client.send(f"END {winner}")
+                client.session = None
+
+    def disconnect(self, client):
+        if self.waiting is client:
+            self.waiting = None
+        session = client.session
+        if session is not None:
+            client.session = None
+            self.end_session(session, 0)
+
+
+async def main(host, port, workers, report):
+    server = GameServer(workers)
+    port = await server.start(host, port)
+    print(f"Listening on {host}:{port} with {server.workers} bot workers")
+    try:
+        while True:
+            await asyncio.sleep(report)
+            print(server.report())
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hosts Neutron games for clients connected over TCP (line protocol).")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("-p", "--port", type=int, default=7777, help="Port to listen on")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Number of worker processes for bots (default: all cores)")
+    parser.add_argument("-r", "--report", type=float, default=10, help="Seconds between statistics reports")
+    args = parser.parse_args()
+    try:
+        asyncio.run(main(args.host, args.port, args.workers, args.report))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,142 @@
+from main import BitBoard
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from os import cpu_count
+from time import perf_counter
+
+import argparse
+import random
+import players as player_classes
+
+
+def play_game(players, board=None, max_turns=1000, recorder=None):
+    """
+    Plays one game without interface and returns id of the winner (3 for draw).
+    Turns are played like in Game.play(): random player starts, first turn has no neutron slide.
+    Game stopped after max_turns is a draw.
+
+    :param players: Two players (ids 1 and 2)
+    :type players: list of Player
+
+    :param board: Starting board, None creates BitBoard
+    :type board: Board
+
+    :param recorder: Object recording the game (e.g. records.RecordWriter), game has to start from starting position
+    """
+    if board is None:
+        board = BitBoard()
+    active_player = random.choice(players)
+    for player in players:
+        player.recorder = recorder
+    if recorder is not None:
+        recorder.start_game(players, active_player.get_id())
+    winner = play_turns(players, board, active_player, max_turns)
+    if recorder is not None:
+        recorder.end_game(winner)
+    return winner
+
+
+def play_turns(players, board, active_player, max_turns):
+    """
+    Plays turns of the game started by active player until the end. Returns id of the winner (3 for draw).
+    """
+    first_turn = True
+
+    for turn in range(max_turns):
+        # Neutron turn
+        if not first_turn:
+            neutron = board.get_neutron()
+            target = active_player.get_selected_target(neutron, board, None)
+            active_player.move_pawn(neutron, target, board)
+            winner = board.get_neutron_winner(active_player)
+            if winner is not None:
+                return winner
+        first_turn = False
+
+        # Pawn turn
+        pawn = active_player.get_selected_pawn(board, None)
+        target = active_player.get_selected_target(pawn, board, None)
+        active_player.move_pawn(pawn, target, board)
+        winner = board.get_winner()
+        if winner is not None:
+            return winner
+
+        if active_player is players[0]:
+            active_player = players[1]
+        else:
+            active_player = players[0]
+    return 3
+
+
+def play_games(player_1, player_2, games, seed=None, board_class=BitBoard, max_turns=1000):
+    """
+    Plays games between two players. Returns list of results [unused, player 1 wins, player 2 wins, draws].
+    Used as task of process pool.
+
+    :param player_1: Player class (or any callable taking id) of player 1
+    :param player_2: Player class (or any callable taking id) of player 2
+    """
+    if seed is not None:
+        random.seed(seed)
+    results = [0, 0, 0, 0]
+    _players = [player_1(1), player_2(2)]
+    for game in range(games):
+        results[play_game(_players, board_class(), max_turns)] += 1
+    for player in _players:
+        if hasattr(player, "close"):
+            player.close()
+    return results
+
+
+def run_games(player_1, player_2, games, workers=None, seed=None, board_class=BitBoard, max_turns=1000):
+    """
+    Plays games between two players split between worker processes.
+    Returns dictionary with wins, losses and draws of player 1, number of games, time and games per second.
+
+    :param player_1: Player class (or any callable taking id) of player 1
+    :param player_2: Player class (or any callable taking id) of player 2
+
+    :param workers: Number of worker processes, None uses all cores, 1 plays in this process.
+    :type workers: int
+    """
+    if workers is None:
+        workers = cpu_count() or 1
+    workers = max(1, min(workers, games))
+    tasks = []
+    for worker in range(workers):
+        worker_seed = None if seed is None else seed + worker
+        tasks.append((player_1, player_2, games // workers + (worker < games % workers), worker_seed, board_class, max_turns))
+
+    start = perf_counter()
+    if workers == 1:
+        chunks = [play_games(*tasks[0])]
+    else:
+        # Workers are spawned (not forked from a process that may have pygame initialised) and are not
+        # daemonic, so players can start their own worker processes (e.g. MCTSBot)
+        with ProcessPoolExecutor(workers, mp_context=get_context("spawn")) as pool:
+            chunks = list(pool.map(play_games, *zip(*tasks)))
+    seconds = perf_counter() - start
+
+    results = [sum(chunk[id] for chunk in chunks) for id in range(4)]
+    return {
+        "wins": results[1],
+        "losses": results[2],
+        "draws": results[3],
+        "games": games,
+        "seconds": seconds,
+        "games_per_second": games / seconds if seconds > 0 else float("inf"),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plays games between two bots without interface.")
+    parser.add_argument("player_1", help="Class of player 1 from players.py (e.g. SmartBot)")
+    parser.add_argument("player_2", help="Class of player 2 from players.py (e.g. RandomBot)")
+    parser.add_argument("-n", "--games", type=int, default=100, help="Number of games")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Number of worker processes (default: all cores)")
+    parser.add_argument("-s", "--seed", type=int, default=None, help="Random seed")
+    args = parser.parse_args()
+
+    result = run_games(getattr(player_classes, args.player_1), getattr(player_classes, args.player_2), args.games, args.workers, args.seed)
+    print(f"{args.player_1} vs {args.player_2}: {result['wins']} wins, {result['losses']} losses, {result['draws']} draws")
+    print(f"{result['games']} games in {result['seconds']:.2f} s ({result['games_per_second']:.1f} games/s)")
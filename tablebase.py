@@ -0,0 +1,281 @@
+from main import BitBoard
+from array import array
+from collections import deque
+from math import comb
+from mmap import mmap, ACCESS_READ
+from struct import Struct
+from time import perf_counter
+
+import argparse
+
+
+# Tablebase
+# Position is neutron cell, cells of pawns of both players and player who moves (before neutron slide).
+# Positions with given number of pawns of every player are indexed as
+# ((neutron * C(24, pawns) + rank(pawns 1)) * C(24 - pawns, pawns) + rank(pawns 2)) * 2 + player - 1,
+# where rank is index of set of cells (without cells taken by neutron and pawns 1) in combinatorial number system.
+# Every position is stored as one byte: DRAW, WIN + distance or LOSS + distance (distance in full turns
+# of both players until the game ends, including this one) or INVALID for finished positions.
+# Full game (5 pawns) has 25 * C(24, 5) * C(19, 5) * 2 (about 2.5 * 10^10) positions, so solver is
+# meant for variants with fewer pawns, bots probe the tablebase only if number of pawns matches.
+# Pawns are never captured, so standard game doesn't reach positions of these tablebases.
+TABLEBASE_MAGIC = b"NTB"
+TABLEBASE_VERSION = 1
+# magic, version, pawns of every player, number of positions
+TABLEBASE_HEADER = Struct("<3sBBQ")
+
+DRAW = 0
+WIN = 1
+LOSS = 128
+INVALID = 255
+MAX_DISTANCE = 126
+
+
+def count_positions(pawns):
+    """
+    Returns number of indexed positions with given number of pawns of every player.
+    """
+    return 25 * comb(24, pawns) * comb(24 - pawns, pawns) * 2
+
+
+def rank(mask, taken):
+    """
+    Returns rank of set of cells (mask) among sets of the same size of cells not taken (mask).
+    """
+    _rank = 0
+    number = 0
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+        number += 1
+        _rank += comb(bit.bit_length() - 1 - bin(taken & (bit - 1)).count("1"), number)
+    return _rank
+
+
+def position_index(board, player_id, pawns):
+    """
+    Returns index of position or None if board doesn't have given number of pawns of every player.
+
+    :param board: Board
+    :type board: Board
+
+    :param player_id: id of player who moves
+    :type player_id: int
+    """
+    pawns_1 = board.get_mask(1)
+    pawns_2 = board.get_mask(2)
+    if bin(pawns_1).count("1") != pawns or bin(pawns_2).count("1") != pawns:
+        return None
+    neutron = board.get_mask(3)
+    index = (neutron.bit_length() - 1) * comb(24, pawns) + rank(pawns_1, neutron)
+    index = index * comb(24 - pawns, pawns) + rank(pawns_2, neutron | pawns_1)
+    return index * 2 + player_id - 1
+
+
+def iterate_masks(cells, pawns):
+    """
+    Yields masks of all sets of given number of cells in order of their rank (see rank()).
+    """
+    if pawns == 0:
+        yield 0
+        return
+    for last in range(pawns - 1, len(cells)):
+        for mask in iterate_masks(cells[:last], pawns - 1):
+            yield mask | 1 << cells[last]
+
+
+def iterate_positions(pawns):
+    """
+    Yields masks of neutron, pawns of player 1 and pawns of player 2 of all positions in order of their index.
+    """
+    for neutron in range(25):
+        cells = [cell for cell in range(25) if cell != neutron]
+        for pawns_1 in iterate_masks(cells, pawns):
+            free = [cell for cell in cells if not pawns_1 >> cell & 1]
+            for pawns_2 in iterate_masks(free, pawns):
+                yield 1 << neutron, pawns_1, pawns_2
+
+
+def solve(pawns, progress=None):
+    """
+    Solves all positions with given number of pawns of every player by retrograde analysis.
+    Returns bytearray of values of positions (see module description).
+    Moves follow Board.generate_turns(), game ends when Board.get_turn_winner() isn't None.
+    Player who can't make any turn draws.
+
+    :param progress: Function called with name of finished step, None prints nothing
+    """
+    size = count_positions(pawns)
+    values = bytearray(size)
+    # Number of turns of position that don't lead to loss yet (draw turns are never counted down)
+    remaining = array('H', bytes(2 * size))
+    children = []
+    queue = deque()
+    board = BitBoard()
+
+    # Turns of every position: immediate results and edges to positions of the other player
+    for index, (neutron, pawns_1, pawns_2) in enumerate(iterate_positions(pawns)):
+        board.masks = [0, pawns_1, pawns_2, neutron]
+        if board.get_winner() is not None:
+            values[2 * index] = values[2 * index + 1] = INVALID
+            continue
+        for player_id in (1, 2):
+            position = 2 * index + player_id - 1
+            win = False
+            suicides = 0
+            position_children = []
+            for turn in board.generate_turns(player_id):
+                board.make_move(turn)
+                winner = board.get_turn_winner(turn)
+                if winner == player_id:
+                    win = True
+                elif winner == 3 - player_id:
+                    suicides += 1
+                elif winner is None:
+                    position_children.append(position_index(board, 3 - player_id, pawns))
+                else:
+                    position_children.append(-1)
+                board.unmake_move()
+            children.append((position, position_children))
+            if win:
+                values[position] = WIN + 1
+                queue.append(position)
+            elif position_children == []:
+                if suicides:
+                    values[position] = LOSS + 1
+                    queue.append(position)
+            else:
+                remaining[position] = len(position_children)
+    if progress is not None:
+        progress("turns")
+
+    # Parents of every position (compressed sparse rows)
+    counts = array('I', bytes(4 * (size + 1)))
+    for position, position_children in children:
+        for child in position_children:
+            if child >= 0:
+                counts[child + 1] += 1
+    for position in range(size):
+        counts[position + 1] += counts[position]
+    parents = array('I', bytes(4 * counts[size]))
+    filled = array('I', counts)
+    for position, position_children in children:
+        for child in position_children:
+            if child >= 0:
+                parents[filled[child]] = position
+                filled[child] += 1
+    del children, filled
+    if progress is not None:
+        progress("parents")
+
+    # Positions are resolved in order of distance, so wins are shortest and losses longest
+    while queue:
+        position = queue.popleft()
+        value = values[position]
+        distance = value - LOSS if value > LOSS else value - WIN
+        if distance >= MAX_DISTANCE:
+            continue
+        for parent in parents[counts[position]:counts[position + 1]]:
+            if values[parent] != DRAW:
+                continue
+            if value > LOSS:
+                values[parent] = WIN + distance + 1
+                queue.append(parent)
+            else:
+                remaining[parent] -= 1
+                if remaining[parent] == 0:
+                    values[parent] = LOSS + distance + 1
+                    queue.append(parent)
+    if progress is not None:
+        progress("values")
+    return values
+
+
+def save_tablebase(path, pawns, values):
+    with open(path, "wb") as file:
+        file.write(TABLEBASE_HEADER.pack(TABLEBASE_MAGIC, TABLEBASE_VERSION, pawns, len(values)))
+        file.write(values)
+
+
+class Tablebase:
+    """
+    Solved positions read from tablebase file through mmap (file isn't loaded to memory).
+    :params path: Path of tablebase file created by save_tablebase().
+    """
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.data = mmap(self.file.fileno(), 0, access=ACCESS_READ)
+        magic, version, self.pawns, self.size = TABLEBASE_HEADER.unpack_from(self.data)
+        if magic != TABLEBASE_MAGIC or version != TABLEBASE_VERSION or len(self.data) != TABLEBASE_HEADER.size + self.size:
+            self.close()
+            raise ValueError("Not a tablebase")
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    def probe(self, board, player_id):
+        """
+        Returns (result, distance) of position, where result is WIN, LOSS or DRAW from the view
+        of player who moves and distance is number of full turns until the end (0 for draw).
+        Returns None if position isn't in the tablebase (other number of pawns or finished game).
+        """
+        index = position_index(board, player_id, self.pawns)
+        if index is None:
+            return None
+        value = self.data[TABLEBASE_HEADER.size + index]
+        if value == INVALID:
+            return None
+        if value > LOSS:
+            return LOSS, value - LOSS
+        if value > DRAW:
+            return WIN, value - WIN
+        return DRAW, 0
+
+    def best_turn(self, board, player_id):
+        """
+        Returns best encoded turn: shortest win, otherwise draw, otherwise longest loss.
+        Returns None if position isn't in the tablebase or player can't move.
+        """
+        if self.probe(board, player_id) is None:
+            return None
+        best_turn = None
+        best_score = None
+        for turn in list(board.generate_turns(player_id)):
+            board.make_move(turn)
+            winner = board.get_turn_winner(turn)
+            if winner == player_id:
+                score = 1000
+            elif winner == 3 - player_id:
+                score = -1000
+            elif winner == 3:
+                score = 0
+            else:
+                result, distance = self.probe(board, 3 - player_id)
+                if result == LOSS:
+                    score = 1000 - distance
+                elif result == WIN:
+                    score = distance - 1000
+                else:
+                    score = 0
+            board.unmake_move()
+            if best_score is None or score > best_score:
+                best_score = score
+                best_turn = turn
+        return best_turn
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Solves positions with given number of pawns by retrograde analysis.")
+    parser.add_argument("pawns", type=int, help="Number of pawns of every player")
+    parser.add_argument("path", help="Output tablebase file")
+    args = parser.parse_args()
+
+    print(f"{count_positions(args.pawns)} positions")
+    start = perf_counter()
+    values = solve(args.pawns, lambda step: print(f"{step}: {perf_counter() - start:.1f} s"))
+    save_tablebase(args.path, args.pawns, values)
+    wins = sum(1 for value in values if WIN <= value < LOSS)
+    losses = sum(1 for value in values if LOSS < value < INVALID)
+    draws = values.count(DRAW)
+    print(f"{wins} wins, {losses} losses, {draws} draws")
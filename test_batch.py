@@ -0,0 +1,80 @@
+from main import Board, BitBoard, CELLS
+from batch import BatchGame, random_policy
+from random import Random
+import numpy as np
+
+
+def random_boards(games, seed):
+    rng = Random(seed)
+    boards = []
+    for game in range(games):
+        board = BitBoard()
+        player_id = 1
+        turns = list(board.generate_turns(player_id, neutron=False))
+        for turn in range(rng.randrange(8)):
+            board.make_move(rng.choice(turns))
+            player_id = 3 - player_id
+            turns = [turn for turn in board.generate_turns(player_id) if turn & 1023]
+            if turns == [] or board.get_winner() is not None:
+                break
+        boards.append(board.get_board())
+    return boards
+
+
+def test_start_position():
+    batch = BatchGame(3, seed=0)
+    assert (batch.boards == np.array(Board().get_board())).all()
+    assert list(batch.get_winners(np.arange(3))) == [0, 0, 0]
+
+
+def test_slide_targets():
+    boards = random_boards(30, seed=3)
+    batch = BatchGame(boards=boards, seed=0)
+    assert (batch.boards == np.array(boards)).all()
+
+    games = np.arange(len(boards))
+    for cell in range(25):
+        targets = batch.slide_targets(games, np.full(len(boards), cell))
+        for game, board in enumerate(boards):
+            if board[cell // 5][cell % 5] != 0:
+                expected = sorted(row * 5 + column for row, column in BitBoard(custom=board).get_all_max_paths(CELLS[cell]))
+                assert sorted(target for target in targets[game] if target >= 0) == expected
+
+
+def test_play():
+    batch = BatchGame(500, seed=1)
+    winners = batch.play()
+    assert set(winners) <= {1, 2, 3}
+    for board, winner in zip(batch.boards, winners):
+        board_winner = Board(custom=board.tolist()).get_winner()
+        if board_winner is not None:
+            assert board_winner == winner
+    assert batch.positions > 500
+
+
+def test_finished_boards():
+    blocked = [
+        [2, 2, 0, 0, 0],
+        [2, 2, 0, 0, 0],
+        [3, 2, 0, 0, 0],
+        [1, 1, 0, 0, 0],
+        [1, 1, 1, 0, 0]
+    ]
+    won = [
+        [2, 2, 3, 2, 2],
+        [0, 0, 2, 0, 0],
+        [0, 0, 0, 0, 0],
+        [0, 0, 0, 0, 0],
+        [1, 1, 1, 1, 1]
+    ]
+    batch = BatchGame(boards=[blocked, won], seed=0)
+    assert list(batch.winner) == [3, 2]
+    assert batch.step() == 0
+    assert list(batch.play()) == [3, 2]
+    assert (batch.boards == np.array([blocked, won])).all()
+
+
+def test_random_policy_blocked_row():
+    batch = BatchGame(2, seed=0)
+    targets = np.array([[-1, -1, -1], [-1, 7, -1]])
+    assert list(random_policy(batch, np.arange(2), targets)) == [-1, 1]
@@ -0,0 +1,28 @@
+from benchmarks import BENCHMARKS, benchmark_positions, run_benchmarks, compare, save_baseline, load_baseline
+from main import Board
+
+
+def test_positions():
+    positions = benchmark_positions(10, seed=1)
+    assert positions == benchmark_positions(10, seed=1)
+    assert len(positions) == 10
+    for rows in positions:
+        assert Board(custom=rows).get_winner() is None
+
+
+def test_run_benchmarks(tmp_path):
+    names = ["bitboard.get_all_max_paths", "game.get_winner", "smartbot.move"]
+    results = run_benchmarks(names, repeat=1, min_time=0, positions=benchmark_positions(3))
+    assert list(results) == names
+    assert all(seconds > 0 for seconds in results.values())
+    assert set(names) <= set(BENCHMARKS)
+
+    save_baseline(tmp_path / "baseline.json", results)
+    assert load_baseline(tmp_path / "baseline.json") == results
+
+
+def test_compare():
+    baseline = {"a": 1.0, "b": 1.0}
+    assert compare({"a": 1.1, "b": 0.5, "c": 5.0}, baseline) == []
+    assert compare({"a": 1.3, "b": 1.0}, baseline) == [("a", 1.3, 1.0)]
+    assert compare({"a": 1.3}, baseline, tolerance=0.5) == []
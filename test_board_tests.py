@@ -1,6 +1,9 @@
-from main import Board, Game
+from main import Board, BitBoard, Game, NEUTRON_PHASE, PAWN_PHASE, END_PHASE, NO_SLIDE, encode_slide, encode_turn, decode_turn, decode_slide
 from players import Player
-from errors import ModeNotExist
+from errors import ModeNotExist, WrongPawn, WrongTarget, GameOver
+from interfaces import TextInterface
+from io import StringIO
+from random import Random
 import pytest
 
 
@@ -26,6 +29,109 @@ def test_move():
     assert board.get_pawn((1, 0)) == 1
 
 
+def test_pawns_index():
+    board = Board()
+
+    assert board.get_neutron() == (2, 2)
+    assert board.get_pawns_by_id(1) == [(4, 0), (4, 1), (4, 2), (4, 3), (4, 4)]
+
+    board.replace((2, 2), (1, 1))
+    board.replace((4, 0), (1, 0))
+
+    assert board.get_neutron() == (1, 1)
+    assert board.get_pawns_by_id(1) == [(1, 0), (4, 1), (4, 2), (4, 3), (4, 4)]
+    assert (4, 0) in board.get_pawns_by_id(0)
+    assert (1, 0) not in board.get_pawns_by_id(0)
+
+
+@pytest.mark.parametrize("board_class", [Board, BitBoard])
+def test_make_unmake_move(board_class):
+    board = board_class()
+    start = board.get_board()
+
+    first_turn = encode_turn(NO_SLIDE, encode_slide((4, 0), (1, 0)))
+    second_turn = encode_turn(encode_slide((2, 2), (1, 1)), encode_slide((0, 4), (3, 4)))
+    assert decode_turn(second_turn) == (encode_slide((2, 2), (1, 1)), encode_slide((0, 4), (3, 4)))
+
+    board.make_move(first_turn)
+    after_first = board.get_board()
+    board.make_move(second_turn)
+
+    assert board.get_neutron() == (1, 1)
+    assert board.get_pawn((1, 0)) == 1
+    assert board.get_pawn((3, 4)) == 2
+    assert board.get_pawn((0, 4)) == 0
+
+    assert board.unmake_move() == second_turn
+    assert board.get_board() == after_first
+    assert board.unmake_move() == first_turn
+    assert board.get_board() == start
+    assert board.get_neutron() == (2, 2)
+    assert board.history == []
+
+
+def brute_force_turns(board, player_id):
+    turns = set()
+    neutron = board.get_neutron()
+    for neutron_target in board.get_all_max_paths(neutron):
+        board.replace(neutron, neutron_target)
+        if neutron_target[0] in (0, 4) or board.get_all_max_paths(neutron_target) == [] or board.get_possible_pawns(Player(player_id)) == []:
+            turns.add(encode_turn(encode_slide(neutron, neutron_target), NO_SLIDE))
+        else:
+            for pawn in board.get_pawns_by_id(player_id):
+                for target in board.get_all_max_paths(pawn):
+                    turns.add(encode_turn(encode_slide(neutron, neutron_target), encode_slide(pawn, target)))
+        board.replace(neutron_target, neutron)
+    return turns
+
+
+def test_generate_first_turns():
+    board = Board()
+    slides = {decode_slide(slide) for slide in board.generate_turns(1, neutron=False)}
+
+    assert len(slides) == 13
+    assert ((4, 0), (1, 0)) in slides
+    assert ((4, 2), (2, 4)) in slides
+
+
+@pytest.mark.parametrize("board_class", [Board, BitBoard])
+def test_generate_turns(board_class):
+    rng = Random(1)
+    for _ in range(10):
+        board = board_class()
+        player_id = 1
+        turns = list(board.generate_turns(player_id, neutron=False))
+        for _ in range(20):
+            board.make_move(rng.choice(turns))
+            player_id = 3 - player_id
+            turns = list(board.generate_turns(player_id))
+            assert len(turns) == len(set(turns))
+            assert set(turns) == brute_force_turns(board, player_id)
+            turns = [turn for turn in turns if turn & 1023 != NO_SLIDE]
+            if turns == []:
+                break
+
+
+@pytest.mark.parametrize("board_class", [Board, BitBoard])
+def test_generate_turns_blocked_pawns(board_class):
+    board = board_class(custom=[
+        [0, 0, 0, 0, 2],
+        [0, 3, 0, 0, 0],
+        [0, 0, 0, 0, 0],
+        [2, 0, 0, 0, 0],
+        [1, 2, 0, 0, 0]
+    ])
+    draw = encode_turn(encode_slide((1, 1), (3, 1)), NO_SLIDE)
+    assert draw in set(board.generate_turns(1))
+    assert set(board.generate_turns(1)) == brute_force_turns(board, 1)
+
+    board.make_move(draw)
+    assert board.get_winner() is None
+    assert board.get_turn_winner(draw) == 3
+    assert board.get_neutron_winner(Player(1)) == 3
+    assert board.get_neutron_winner(Player(2)) is None
+
+
 def test_possible_pawns():
     board = Board()
     player = Player(1)
@@ -58,6 +164,69 @@ def test_all_max_paths():
     assert board.get_all_max_paths((4, 2)) == sorted([(2, 0), (3, 2), (2, 4)])
 
 
+def test_bitboard_basic():
+    board = BitBoard()
+
+    assert board.get_board() == Board().get_board()
+    assert board.get_neutron() == (2, 2)
+    assert board.get_max_directed_path((4, 0), (-1, 0)) == (1, 0)
+    assert board.get_max_directed_path((4, 2), (-1, 1)) == (2, 4)
+    assert board.get_all_max_paths((4, 2)) == sorted([(2, 0), (3, 2), (2, 4)])
+
+
+def test_bitboard_custom():
+    custom = [
+        [0, 0, 2, 2, 2],
+        [0, 0, 0, 0, 0],
+        [0, 0, 3, 0, 0],
+        [2, 2, 0, 0, 0],
+        [1, 1, 1, 1, 1]
+    ]
+    board = BitBoard(custom=custom)
+
+    assert board.get_board() == custom
+    assert board.get_possible_pawns(Player(1)) == Board(custom=custom).get_possible_pawns(Player(1))
+    assert board.get_pawns_by_id(2) == [(0, 2), (0, 3), (0, 4), (3, 0), (3, 1)]
+
+
+def test_bitboard_matches_board():
+    rng = Random(0)
+    for _ in range(20):
+        board = Board()
+        bitboard = BitBoard()
+        for _ in range(30):
+            for id in (1, 2, 3):
+                for pawn in board.get_pawns_by_id(id):
+                    assert bitboard.get_all_max_paths(pawn) == board.get_all_max_paths(pawn)
+            assert bitboard.get_board() == board.get_board()
+
+            pawn = rng.choice(board.get_pawns_by_id(rng.choice((1, 2, 3))))
+            if board.get_all_max_paths(pawn) == []:
+                break
+            target = rng.choice(board.get_all_max_paths(pawn))
+            board.replace(pawn, target)
+            bitboard.replace(pawn, target)
+
+
+@pytest.mark.parametrize("board_class", [Board, BitBoard])
+def test_moves_cache(board_class):
+    board = board_class()
+    player = Player(1)
+    paths = board.get_all_max_paths((4, 2))
+    pawns = board.get_possible_pawns(player)
+    assert board.get_all_max_paths((4, 2)) is paths
+    assert board.get_possible_pawns(player) is pawns
+
+    board.replace((4, 2), (3, 2))
+    assert board.get_all_max_paths((3, 2)) == [(1, 0), (1, 4), (3, 0), (3, 4), (4, 2)]
+    assert board.get_possible_pawns(player) == [(3, 2), (4, 0), (4, 1), (4, 3), (4, 4)]
+
+    board.make_move(encode_turn(encode_slide((2, 2), (1, 2)), encode_slide((3, 2), (2, 2))))
+    assert board.get_all_max_paths((2, 2)) == [(1, 1), (1, 3), (2, 0), (2, 4), (3, 1), (3, 3), (4, 2)]
+    board.unmake_move()
+    assert board.get_all_max_paths((3, 2)) == Board(custom=board.get_board()).get_all_max_paths((3, 2))
+
+
 # Game
 def test_mode():
     with pytest.raises(ModeNotExist):
@@ -70,3 +239,97 @@ def test_mode():
 def test_game_ends():
     game = Game(video_mode=1, game_mode=4)
     game.play()
+
+
+class NeutronBot(Player):
+    """
+    Bot moving neutron to given target, it never moves pawns.
+    """
+    def __init__(self, id, target):
+        super().__init__(id)
+        self.target = target
+
+    def get_selected_target(self, pawn, board, interface):
+        return self.target
+
+
+def test_game_blocked_pawns_draw(monkeypatch):
+    rows = [
+        [0, 0, 0, 0, 2],
+        [0, 3, 0, 0, 0],
+        [0, 0, 0, 0, 0],
+        [2, 0, 0, 0, 0],
+        [1, 2, 0, 0, 0]
+    ]
+    game = Game(video_mode=1, game_mode=4, first_turn=False)
+    game.board = Board(custom=[row[:] for row in rows])
+    game.interface = TextInterface(game.board, output=StringIO())
+    game.interface.wait = lambda milliseconds: None
+    game.players = [NeutronBot(1, (3, 1)), NeutronBot(2, (3, 1))]
+    monkeypatch.setattr("main.choice", lambda players: players[0])
+    assert game.play() == 3
+
+    game = Game(video_mode=1, game_mode=4, first_turn=False)
+    game.board = Board(custom=[row[:] for row in rows])
+    game.start(first_player=1)
+    assert ((1, 1), (3, 1)) in game.legal_actions()
+    assert game.apply(((1, 1), (3, 1))) == 3
+
+
+def test_game_state_machine():
+    game = Game(video_mode=1, game_mode=4)
+    with pytest.raises(GameOver):
+        game.apply(((4, 0), (3, 0)))
+
+    game.start(first_player=2)
+    assert game.phase == PAWN_PHASE
+    assert len(game.legal_actions()) == 13
+    with pytest.raises(WrongPawn):
+        game.apply(((4, 0), (3, 0)))
+    with pytest.raises(WrongTarget):
+        game.apply(((0, 0), (2, 0)))
+    assert game.apply(((0, 0), (3, 0))) is None
+    assert game.phase == NEUTRON_PHASE
+    assert game.active_player.get_id() == 1
+    assert game.legal_actions() == [((2, 2), target) for target in game.board.get_all_max_paths((2, 2))]
+    with pytest.raises(WrongPawn):
+        game.apply(((4, 0), (3, 1)))
+
+    assert game.apply(((2, 2), (3, 2))) is None
+    assert game.phase == PAWN_PHASE
+    assert game.apply(game.legal_actions()[0]) is None
+    assert game.phase == NEUTRON_PHASE
+    assert game.active_player.get_id() == 2
+
+
+def test_game_state_machine_end():
+    game = Game(video_mode=1, game_mode=4, first_turn=False)
+    game.board = Board(custom=[
+        [2, 2, 2, 2, 0],
+        [0, 0, 0, 0, 0],
+        [0, 0, 0, 0, 2],
+        [0, 3, 0, 0, 0],
+        [1, 0, 1, 1, 1]
+    ])
+    game.start(first_player=1)
+    assert game.phase == NEUTRON_PHASE
+    assert game.apply(((3, 1), (4, 1))) == 1
+    assert game.phase == END_PHASE
+    assert game.winner == 1
+    assert game.legal_actions() == []
+    with pytest.raises(GameOver):
+        game.apply(((4, 0), (3, 0)))
+
+
+def test_game_state_machine_bots():
+    for seed in range(20):
+        game = Game(video_mode=1, game_mode=4)
+        game.start()
+        actions = 0
+        while game.phase != END_PHASE:
+            action = game.bot_action()
+            assert action in game.legal_actions()
+            game.apply(action)
+            actions += 1
+        assert game.winner in (1, 2, 3)
+        assert actions > 1
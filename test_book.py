@@ -0,0 +1,69 @@
+from main import Board, BitBoard, encode_slide
+from players import SmartBot, RandomBot, BookBot
+from book import OpeningBook, self_play, build_book, save_book, record_turns
+from interfaces import TextInterface
+import pytest
+
+
+@pytest.fixture(scope="module")
+def records():
+    return self_play(SmartBot, RandomBot, 200, seed=4)
+
+
+@pytest.fixture
+def book(records, tmp_path):
+    save_book(tmp_path / "book.bin", build_book(records, turns=4))
+    book = OpeningBook(tmp_path / "book.bin")
+    yield book
+    book.close()
+
+
+def test_record_turns(records):
+    for record in records[:20]:
+        turns = list(record_turns(record, 1000))
+        assert turns[0][2] >> 10 == 0
+        board = Board()
+        for player_id, before, turn in turns:
+            assert before.get_board() == board.get_board()
+            assert turn in board.generate_turns(player_id, before is not turns[0][1])
+            board.make_move(turn)
+        assert board.get_winner() == record.winner or record.winner == 3
+
+
+def test_build_book(records):
+    entries = build_book(records, turns=4)
+    assert entries == sorted(entries)
+    assert all(0 <= score <= 2 * games for key, turn, games, score in entries)
+    assert len({(key, turn) for key, turn, games, score in entries}) == len(entries)
+
+
+def test_probe(book):
+    board = Board()
+    first_turns = book.probe(board, 1) + book.probe(board, 2)
+    assert sum(games for turn, games, score in first_turns) == 200
+    for player_id in (1, 2):
+        legal = set(board.generate_turns(player_id, neutron=False))
+        assert all(turn in legal for turn, games, score in book.probe(board, player_id))
+        assert book.best_turn(board, player_id, neutron=False, min_games=1) in legal
+
+    # Reflected position has reflected turns with the same statistics
+    board.replace((4, 0), (1, 0))
+    mirrored = Board(custom=[row[::-1] for row in board.get_board()])
+    assert len(book.probe(board, 2)) == len(book.probe(mirrored, 2)) > 0
+    assert sorted(games for turn, games, score in book.probe(board, 2)) == sorted(games for turn, games, score in book.probe(mirrored, 2))
+    assert book.probe(BitBoard(custom=[[0] * 5] * 2 + [[0, 0, 3, 0, 0]] + [[1] * 5, [2] * 5]), 1) == []
+
+
+def test_book_bot(book):
+    board = Board()
+    bot = BookBot(1, book, min_games=1, time_limit=0.01)
+    turn = book.best_turn(board, 1, neutron=False, min_games=1)
+    pawn = bot.get_selected_pawn(board, TextInterface(board))
+    target = bot.get_selected_target(pawn, board, TextInterface(board))
+    assert encode_slide(pawn, target) == turn
+
+
+def test_not_book(tmp_path):
+    (tmp_path / "book.bin").write_bytes(b"NOB\x01" + bytes(10))
+    with pytest.raises(ValueError):
+        OpeningBook(tmp_path / "book.bin")
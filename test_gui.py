@@ -0,0 +1,129 @@
+from main import Board
+from interfaces import GUI
+import os
+import pytest
+
+pytest.importorskip("pygame")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+@pytest.fixture
+def gui():
+    import pygame
+    gui = GUI(Board())
+    yield gui
+    pygame.quit()
+
+
+def test_font_cache(gui):
+    assert gui.get_font() is gui.get_font()
+    assert gui.get_font(20) is not gui.get_font()
+
+
+def test_text_cache(gui):
+    text = gui.render_text("Player 1 wins...", (0, 0, 0))
+    assert gui.render_text("Player 1 wins...", (0, 0, 0)) is text
+    assert gui.render_text("Player 1 wins...", (255, 0, 0)) is not text
+
+    gui.texts_size = 2
+    gui.render_text("a", (0, 0, 0))
+    gui.render_text("b", (0, 0, 0))
+    assert len(gui.texts) == 2
+    assert gui.render_text("Player 1 wins...", (0, 0, 0)) is not text
+
+
+def test_print_header(gui):
+    gui.print_header("Player's 1 Turn")
+    gui.print_error("You selected wrong pawn. Try again.")
+    assert ("Player's 1 Turn", (0, 0, 0), 32) in gui.texts
+
+
+def test_dirty_cells(gui):
+    gui.print_header("Player's 1 Turn")
+    assert gui.screen.get_rect() in gui.dirty
+    gui.present()
+    assert gui.dirty == []
+
+    gui.print_header("Player's 1 Turn")
+    assert gui.dirty == []
+
+    gui.board.replace((4, 0), (1, 0))
+    gui.print_header("Player's 1 Turn")
+    assert len(gui.dirty) == 2
+
+
+def test_overlays(gui):
+    gui.print_header("Player's 1 Turn")
+    gui.present()
+
+    gui.print_all_max_paths((4, 2))
+    assert len(gui.dirty) == 3
+    assert gui.drawn_cells[2 * 5 + 4] == (0, (gui.selected_target,))
+
+    gui.present()
+    gui.print_background()
+    assert len(gui.dirty) == 3
+    assert gui.drawn_cells[2 * 5 + 4] == (0, ())
+
+
+def test_error_log(gui):
+    gui.print_header("Player's 1 Turn")
+    gui.print_error("You gave wrong coordinates. Try again.")
+    gui.present()
+
+    gui.print_background()
+    assert gui.dirty == [(0, 550, 600, 50)]
+    assert not gui.drawn_log
+
+
+def click(x, y):
+    import pygame
+    pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(x, y), button=1))
+
+
+def test_select_pawn_click(gui):
+    from players import Player
+    gui.print_header("Player's 1 Turn")
+    click(100, 500)
+    assert gui.select_pawn(Player(1)) == (4, 0)
+    assert gui.dirty == []
+
+
+def test_select_game_mode_click(gui):
+    click(300, 50)
+    click(300, 340)
+    assert gui.select_game_mode() == 2
+    click(300, 540)
+    assert gui.select_game_mode() == 5
+
+
+def test_idle_tasks(gui):
+    calls = []
+
+    def task():
+        calls.append(1)
+        if len(calls) == 2:
+            click(300, 240)
+            return True
+        return False
+
+    gui.idle_timeout = 1
+    gui.add_idle_task(task)
+    assert gui.wait_for_click() == (300, 240)
+    assert len(calls) == 2
+    assert gui.idle_tasks == []
+
+
+def test_sprite_atlas(gui):
+    import pygame
+    for name, image in [("r_pawn", gui.red_pawn), ("active_pawn", gui.active_pawn), ("selected_target", gui.selected_target)]:
+        source = pygame.image.load(f"images/{name}.png")
+        assert image.get_size() == source.get_size()
+        assert image.get_parent() is gui.blue_pawn.get_parent()
+        assert pygame.image.tostring(image, "RGBA") == pygame.image.tostring(source, "RGBA")
+
+
+def test_lazy_images(gui):
+    assert "menu.png" not in gui.images
+    gui.print_winner(1, table=False)
+    assert gui.menu is gui.images["menu.png"]
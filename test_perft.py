@@ -0,0 +1,47 @@
+from main import Board, BitBoard
+from perft import perft, perft_paths, divide, parse_board
+import pytest
+
+
+CUSTOM = "22200/00000/00300/00022/11111"
+
+
+@pytest.mark.parametrize("board_class", [Board, BitBoard])
+def test_perft_start(board_class):
+    board = board_class()
+    assert [perft(board, 1, depth, first_turn=True) for depth in range(4)] == [1, 13, 1026, 58092]
+    assert board.get_board() == Board().get_board()
+    assert board.history == []
+
+
+@pytest.mark.parametrize("board_class", [Board, BitBoard])
+def test_perft_paths(board_class):
+    board = board_class(custom=parse_board(CUSTOM))
+    for player_id in (1, 2):
+        assert perft_paths(board, player_id, 2) == perft(BitBoard(custom=parse_board(CUSTOM)), player_id, 2)
+    assert board.get_board() == parse_board(CUSTOM)
+
+
+def test_perft_blocked_pawns():
+    # Neutron slide (1, 1) -> (3, 1) leaves player 1 without pawn moves, which is a draw
+    board = BitBoard(custom=parse_board("00002/03000/00000/20000/12000"))
+    assert [perft(board, 1, depth) for depth in range(1, 4)] == [8, 46, 747]
+    assert perft_paths(Board(custom=parse_board("00002/03000/00000/20000/12000")), 1, 3) == 747
+    assert divide(board, 1, 3, workers=1) == divide(board, 1, 3, workers=1, counter=perft_paths)
+
+
+def test_perft_finished_game():
+    board = Board(custom=parse_board("22322/00200/00000/00000/11111"))
+    assert perft(board, 1, 2) == 0
+    assert divide(board, 1, 2) == {}
+
+
+def test_divide():
+    board = BitBoard(custom=parse_board(CUSTOM))
+    counts = divide(board, 2, 2, workers=1, board_class=Board)
+    assert sum(counts.values()) == perft(board, 2, 2)
+    assert divide(board, 2, 2, workers=2) == counts
+    assert divide(board, 2, 2, workers=1, counter=perft_paths) == counts
+    assert sum(divide(board, 2, 1).values()) == perft(board, 2, 1)
+    with pytest.raises(ValueError):
+        divide(board, 2, 0)
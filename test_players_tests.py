@@ -1,6 +1,7 @@
-from main import Board
-from players import RandomBot, SmartBot
+from main import Board, BitBoard
+from players import RandomBot, SmartBot, AlphaBetaBot, MCTSBot
 from interfaces import TextInterface
+from time import perf_counter
 
 
 def test_random_bot():
@@ -48,3 +49,85 @@ def test_smart_bot_2():
         [1, 1, 0, 1, 1]
     ])
     assert bot2.get_selected_target((2, 2), board, TextInterface(board)) != (4, 2)
+
+
+def test_alpha_beta_bot_wins():
+    bot = AlphaBetaBot(2, time_limit=0.5)
+    board = Board(custom=[
+        [0, 2, 2, 2, 2],
+        [0, 0, 2, 0, 0],
+        [0, 0, 3, 0, 0],
+        [1, 0, 0, 0, 0],
+        [1, 1, 0, 1, 1]
+    ])
+    assert bot.get_selected_target((2, 2), board, TextInterface(board)) == (0, 0)
+    assert board.history == []
+
+
+def test_alpha_beta_bot_plans_turn():
+    bot = AlphaBetaBot(1, time_limit=0.2, board_class=BitBoard)
+    board = Board()
+
+    neutron = board.get_neutron()
+    target = bot.get_selected_target(neutron, board, TextInterface(board))
+    assert target in board.get_all_max_paths(neutron)
+    board.replace(neutron, target)
+
+    pawn = bot.get_selected_pawn(board, TextInterface(board))
+    assert pawn in board.get_possible_pawns(bot)
+    assert bot.get_selected_target(pawn, board, TextInterface(board)) in board.get_all_max_paths(pawn)
+    assert bot.planned_slide is None
+
+
+def test_alpha_beta_bot_time_limit():
+    bot = AlphaBetaBot(1, time_limit=0.1)
+    board = Board()
+
+    start = perf_counter()
+    pawn = bot.get_selected_pawn(board, TextInterface(board))
+    assert perf_counter() - start < 0.5
+    assert pawn in board.get_possible_pawns(bot)
+
+
+def test_mcts_bot_wins():
+    bot = MCTSBot(2, playouts=500, time_limit=5, workers=1, board_class=BitBoard)
+    board = Board(custom=[
+        [0, 2, 2, 2, 2],
+        [0, 0, 2, 0, 0],
+        [0, 0, 3, 0, 0],
+        [1, 0, 0, 0, 0],
+        [1, 1, 0, 1, 1]
+    ])
+    assert bot.get_selected_target((2, 2), board, TextInterface(board)) == (0, 0)
+    assert board.get_board()[2][2] == 3
+
+
+def test_mcts_bot_workers():
+    bot = MCTSBot(1, playouts=40, time_limit=5, workers=2)
+    board = Board()
+    try:
+        pawn = bot.get_selected_pawn(board, TextInterface(board))
+        assert pawn in board.get_possible_pawns(bot)
+        assert bot.get_selected_target(pawn, board, TextInterface(board)) in board.get_all_max_paths(pawn)
+    finally:
+        bot.close()
+
+
+class RecordingBoard(Board):
+    boards = []
+
+    def __init__(self, custom=None):
+        RecordingBoard.boards.append(custom)
+        super().__init__(custom)
+
+
+def test_search_board_is_copy():
+    board = Board()
+    RecordingBoard.boards = []
+    AlphaBetaBot(1, time_limit=0.05, board_class=RecordingBoard).search(board, neutron=False)
+    MCTSBot(1, playouts=5, workers=1, board_class=RecordingBoard).search(board, neutron=False)
+
+    assert len(RecordingBoard.boards) == 2
+    for custom in RecordingBoard.boards:
+        assert custom == board.get_board()
+        assert all(row is not board_row for row, board_row in zip(custom, board.board))
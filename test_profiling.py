@@ -0,0 +1,42 @@
+from main import Game, Board
+from profiling import Profiler
+
+
+def test_record_and_lap():
+    profiler = Profiler()
+    profiler.record("a", 0.5)
+    profiler.record("a", 0.25)
+    profiler.lap()
+    profiler.lap("b")
+    assert profiler.stats["a"] == [2, 0.75]
+    assert profiler.stats["b"][0] == 1
+    assert profiler.report().splitlines()[1].startswith("a ")
+
+
+def test_instrument():
+    profiler = Profiler()
+    board = Board()
+    profiler.instrument(board, ["get_winner", "missing"], "board")
+    profiler.instrument(board, ["get_winner"], "board")
+    assert board.get_winner() is None
+    assert profiler.stats == {"board.get_winner": [1, profiler.stats["board.get_winner"][1]]}
+    assert not hasattr(Board().get_winner, "profiler")
+
+
+def test_game_profiling(capsys):
+    profiler = Profiler()
+    game = Game(video_mode=1, game_mode=4, profiler=profiler)
+    game.interface.wait = lambda milliseconds: None
+    game.play()
+    for name in ["turn.neutron", "turn.select_pawn", "turn.select_target", "turn.move",
+                 "player1.get_selected_pawn", "board.get_possible_pawns", "board.get_winner", "interface.print_winner"]:
+        assert profiler.stats[name][0] > 0
+    assert profiler.stats["turn.select_pawn"][0] == profiler.stats["turn.move"][0]
+
+
+def test_game_without_profiler(capsys):
+    game = Game(video_mode=1, game_mode=4)
+    game.interface.wait = lambda milliseconds: None
+    game.play()
+    assert not hasattr(game.board.get_all_max_paths, "profiler")
+    assert "get_selected_pawn" not in vars(game.players[0])
@@ -0,0 +1,72 @@
+from main import Board, BitBoard, Game, CELLS
+from players import SmartBot, RandomBot
+from records import RecordWriter, read_records, encode_record_slide, decode_record_slide, RECORD_HEADER
+from simulation import play_game
+from io import BytesIO
+import random
+import pytest
+
+
+def test_record_slide():
+    board = BitBoard()
+    occupied = board.get_occupied()
+    for id in (1, 2, 3):
+        for pawn in board.get_pawns_by_id(id):
+            for target in board.get_all_max_paths(pawn):
+                slide = encode_record_slide(pawn, target)
+                assert 0 <= slide < 256
+                assert decode_record_slide(slide, occupied) == (CELLS.index(pawn), CELLS.index(target))
+
+
+def test_write_and_replay():
+    random.seed(3)
+    stream = BytesIO()
+    writer = RecordWriter(stream)
+    boards = []
+    winners = []
+    for game in range(20):
+        board = BitBoard()
+        winners.append(play_game([SmartBot(1), RandomBot(2)], board, recorder=writer))
+        boards.append(board.get_board())
+    assert writer.games == 20
+
+    stream.seek(0)
+    records = list(read_records(stream))
+    assert [record.winner for record in records] == winners
+    assert records[0].players == ("SmartBot", "RandomBot")
+    for record, final_board in zip(records, boards):
+        board = Board()
+        moves = list(record.replay(board))
+        assert len(moves) == len(record.slides)
+        assert board.get_board() == final_board
+        assert board.get_winner() == record.winner
+
+
+def test_game_recording(capsys):
+    stream = BytesIO()
+    game = Game(video_mode=1, game_mode=4, recorder=RecordWriter(stream))
+    winner = game.play()
+
+    stream.seek(0)
+    record, = read_records(stream)
+    assert record.winner == winner
+    assert record.first_player in (1, 2)
+    board = Board()
+    for move in record.replay(board):
+        pass
+    assert board.get_board() == game.board.get_board()
+
+
+def test_truncated_record():
+    stream = BytesIO()
+    writer = RecordWriter(stream)
+    writer.start_game([SmartBot(1), SmartBot(2)], 1)
+    writer.record((4, 0), (1, 0))
+    writer.end_game(0)
+
+    with pytest.raises(ValueError):
+        list(read_records(BytesIO(stream.getvalue()[:RECORD_HEADER.size])))
+    with pytest.raises(ValueError):
+        list(read_records(BytesIO(b"XX" + stream.getvalue()[2:])))
+    record, = read_records(BytesIO(stream.getvalue()))
+    assert list(record.replay()) == [((4, 0), (1, 0))]
@@ -0,0 +1,107 @@
+from server import GameServer, parse_slide, format_slide, bot_turn, bots
+from main import Board, NEUTRON_PHASE, PAWN_PHASE
+import asyncio
+import pytest
+
+
+async def play_client(port, opponent, moves=None):
+    """
+    Plays game choosing first legal slide. Returns lines received from server.
+    """
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"PLAY {opponent}\n".encode())
+    lines = []
+    while True:
+        line = (await reader.readline()).decode().strip()
+        lines.append(line)
+        if line.startswith("TURN"):
+            slides = line.split()[2:]
+            if moves is not None:
+                moves.append(slides[0])
+            writer.write(f"MOVE {slides[0]}\n".encode())
+        elif line.startswith("END") or line == "":
+            break
+    writer.write(b"QUIT\n")
+    writer.close()
+    return lines
+
+
+def run_server(test, workers=1):
+    async def run():
+        server = GameServer(workers)
+        port = await server.start(port=0)
+        try:
+            return await test(server, port)
+        finally:
+            await server.close()
+    return asyncio.run(run())
+
+
+def test_slide_format():
+    assert parse_slide("4,0,3,0") == ((4, 0), (3, 0))
+    assert format_slide(((4, 0), (3, 0))) == "4,0,3,0"
+    with pytest.raises(ValueError):
+        parse_slide("4,0,3")
+
+
+def test_bot_turn():
+    board = Board()
+    slides = bot_turn("SmartBot", 2, board.get_board(), PAWN_PHASE)
+    assert len(slides) == 1
+    pawn, target = slides[0]
+    assert target in board.get_all_max_paths(pawn)
+
+    board.replace(pawn, target)
+    neutron, neutron_target = bot_turn("RandomBot", 1, board.get_board(), NEUTRON_PHASE)[0]
+    assert neutron == board.get_neutron()
+    assert neutron_target in board.get_all_max_paths(neutron)
+
+    pawn, target = bot_turn("MCTSBot", 2, board.get_board(), NEUTRON_PHASE)[-1]
+    assert bots[("MCTSBot", 2)].workers == 1
+    assert bots[("MCTSBot", 2)].pool is None
+
+
+def test_games_against_bots():
+    async def test(server, port):
+        results = await asyncio.gather(*[play_client(port, "SmartBot" if game % 2 else "RandomBot") for game in range(10)])
+        stats = server.get_stats()
+        return results, stats
+
+    results, stats = run_server(test)
+    for lines in results:
+        assert lines[0].startswith("GAME ")
+        assert lines[-1] in ("END 1", "END 2", "END 3")
+        assert not any(line.startswith("ERROR") for line in lines)
+    assert len({lines[0] for lines in results}) == 10
+    assert stats["games"] == 10
+    assert stats["sessions"] == 0
+    assert stats["moves"] > 10
+    assert stats["latency_ms_mean"] > 0
+
+
+def test_human_game():
+    async def test(server, port):
+        return await asyncio.gather(play_client(port, "human"), play_client(port, "human"))
+
+    first, second = run_server(test)
+    assert first[:2] == ["WAIT", first[1]] and first[1].endswith(" 1")
+    assert second[0].endswith(" 2")
+    assert first[-1] == second[-1]
+    assert [line for line in first if line.startswith("MOVED")] == [line for line in second if line.startswith("MOVED")]
+
+
+def test_errors():
+    async def test(server, port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        lines = []
+        for command in ["MOVE 4,0,3,0", "PLAY Nobody", "HELLO", "PLAY human", "PLAY human", "STATS"]:
+            writer.write(f"{command}\n".encode())
+            lines.append((await reader.readline()).decode().strip())
+        writer.close()
+        await asyncio.sleep(0.1)
+        return lines, server.waiting
+
+    lines, waiting = run_server(test)
+    assert lines[:5] == ["ERROR Not playing", "ERROR Unknown opponent", "ERROR Unknown command", "WAIT", "ERROR Already playing"]
+    assert lines[5].startswith("STATS sessions=0")
+    assert waiting is None
@@ -0,0 +1,27 @@
+from main import Board
+from players import RandomBot, SmartBot, MCTSBot
+from functools import partial
+from simulation import play_game, run_games
+
+
+def test_play_game():
+    board = Board()
+    assert play_game([SmartBot(1), RandomBot(2)], board) in [1, 2, 3]
+    assert board.get_winner() is not None
+
+
+def test_run_games():
+    result = run_games(SmartBot, RandomBot, 20, workers=1, seed=0)
+    assert result["wins"] + result["losses"] + result["draws"] == 20
+    assert result["games_per_second"] > 0
+    assert run_games(SmartBot, RandomBot, 20, workers=1, seed=0)["wins"] == result["wins"]
+
+
+def test_run_games_workers():
+    result = run_games(RandomBot, RandomBot, 9, workers=2, seed=0)
+    assert result["wins"] + result["losses"] + result["draws"] == 9
+
+
+def test_run_games_bot_with_workers():
+    result = run_games(partial(MCTSBot, playouts=4, workers=2), RandomBot, 2, workers=2, seed=0)
+    assert result["wins"] + result["losses"] + result["draws"] == 2
@@ -0,0 +1,106 @@
+from main import Board, BitBoard
+from players import TablebaseBot
+from tablebase import (Tablebase, solve, save_tablebase, iterate_positions, position_index, count_positions,
+                       WIN, LOSS, DRAW, INVALID)
+from interfaces import TextInterface
+import pytest
+
+
+@pytest.fixture(scope="module")
+def values():
+    return solve(1)
+
+
+@pytest.fixture(scope="module")
+def tablebase(values, tmp_path_factory):
+    path = tmp_path_factory.mktemp("tablebase") / "neutron1.bin"
+    save_tablebase(path, 1, values)
+    tablebase = Tablebase(path)
+    yield tablebase
+    tablebase.close()
+
+
+def test_position_index():
+    board = BitBoard()
+    for pawns in (1, 2):
+        positions = iterate_positions(pawns)
+        for index in range(0, count_positions(pawns) // 2, 997):
+            for skipped in range(997 if index else 1):
+                neutron, pawns_1, pawns_2 = next(positions)
+            board.masks = [0, pawns_1, pawns_2, neutron]
+            assert position_index(board, 2, pawns) == 2 * index + 1
+    assert position_index(BitBoard(), 1, 1) is None
+
+
+def test_values_consistent(values):
+    """
+    Value of every position follows from values of positions after its turns.
+    """
+    board = BitBoard()
+    for index, (neutron, pawns_1, pawns_2) in enumerate(iterate_positions(1)):
+        if index % 5:
+            continue
+        board.masks = [0, pawns_1, pawns_2, neutron]
+        for player_id in (1, 2):
+            value = values[2 * index + player_id - 1]
+            if board.get_winner() is not None:
+                assert value == INVALID
+                continue
+            results = []
+            for turn in board.generate_turns(player_id):
+                board.make_move(turn)
+                winner = board.get_turn_winner(turn)
+                if winner is None:
+                    child = values[position_index(board, 3 - player_id, 1)]
+                    results.append(("win", child - LOSS + 1) if child > LOSS else ("loss", child - WIN + 1) if child else ("draw", 0))
+                else:
+                    results.append({player_id: ("win", 1), 3 - player_id: ("loss", 1), 3: ("draw", 0)}[winner])
+                board.unmake_move()
+
+            wins = [distance for result, distance in results if result == "win"]
+            if wins:
+                assert value == WIN + min(wins)
+            elif ("draw", 0) in results or results == []:
+                assert value == DRAW
+            else:
+                assert value == LOSS + max(distance for result, distance in results)
+
+
+def test_probe(tablebase):
+    board = Board(custom=[
+        [0, 0, 2, 0, 0],
+        [0, 0, 0, 0, 0],
+        [0, 0, 3, 0, 0],
+        [0, 0, 0, 0, 0],
+        [0, 0, 0, 0, 1]
+    ])
+    assert tablebase.probe(board, 1) == (WIN, 1)
+    assert tablebase.probe(board, 2) == (WIN, 1)
+    assert tablebase.probe(Board(), 1) is None
+    assert tablebase.best_turn(Board(), 1) is None
+
+
+def test_tablebase_bot(tablebase):
+    board = Board(custom=[
+        [0, 0, 0, 0, 2],
+        [0, 0, 0, 0, 0],
+        [0, 0, 0, 0, 0],
+        [0, 0, 0, 3, 0],
+        [1, 0, 0, 0, 0]
+    ])
+    bot = TablebaseBot(1, tablebase, time_limit=0.1)
+    assert tablebase.probe(board, 1)[0] == WIN
+    neutron = board.get_neutron()
+    bot.move_pawn(neutron, bot.get_selected_target(neutron, board, TextInterface(board)), board)
+    if board.get_winner() is None:
+        pawn = bot.get_selected_pawn(board, TextInterface(board))
+        bot.move_pawn(pawn, bot.get_selected_target(pawn, board, TextInterface(board)), board)
+        assert board.get_winner() in (None, 1)
+    assert board.get_winner() == 1 or tablebase.probe(board, 2)[0] == LOSS
+
+
+def test_not_tablebase(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"NTB" + bytes(20))
+    with pytest.raises(ValueError):
+        Tablebase(path)
@@ -2,6 +2,7 @@ from main import Board
 from players import Player
 from interfaces import TextInterface
 from errors import WrongCoordinates, WrongData, WrongPawn, WrongTarget, BlockedPawn
+from io import StringIO
 import pytest
 
 
@@ -134,3 +135,80 @@ def test_select_target_4():
 
     with pytest.raises(WrongTarget):
         interface.select_target((4, 0), test="3,2")
+
+
+def emulate_terminal(text, lines=24):
+    """
+    Returns lines of terminal after writing text (supports only sequences used by TextInterface).
+    """
+    import re
+    screen = [[] for line in range(lines)]
+    row = column = 0
+    for token in re.findall(r"\033\[[\d;]*[A-Za-z]|\n|[^\033\n]", text):
+        if token == "\n":
+            row, column = row + 1, 0
+        elif token.endswith("H"):
+            row, column = [int(value) - 1 for value in (token[2:-1] or "1;1").split(";")]
+        elif token == "\033[2J":
+            screen = [[] for line in range(lines)]
+        elif token == "\033[2K":
+            screen[row] = []
+        elif token == "\033[J":
+            screen[row] = screen[row][:column]
+            screen[row + 1:] = [[] for line in range(lines - row - 1)]
+        elif not token.startswith("\033"):
+            screen[row] += [" "] * (column + 1 - len(screen[row]))
+            screen[row][column] = token
+            column += 1
+    return ["".join(line).rstrip() for line in screen]
+
+
+def test_frame():
+    import re
+    board = Board()
+    output = StringIO()
+    interface = TextInterface(board, output)
+
+    interface.print_header("Player's 1 Turn")
+    first = output.getvalue()
+    assert first.startswith("\033[2J")
+    assert emulate_terminal(first)[:8] == [
+        "Player's 1 Turn",
+        "",
+        "   0  1  2  3  4",
+        "0  2  2  2  2  2",
+        "1  0  0  0  0  0",
+        "2  0  0  3  0  0",
+        "3  0  0  0  0  0",
+        "4  1  1  1  1  1",
+    ]
+
+    interface.print_possible_pawns(Player(1))
+    interface.print_error("You selected wrong pawn. Try again.")
+    board.replace((4, 2), (1, 2))
+    interface.print_header("Neutron's Turn (Player 2)")
+    frame = output.getvalue()[len(first):]
+    assert "\033[2J" not in frame
+    assert len(re.findall(r"\033\[\d+;\d+H", frame)) == 4  # header, two cells and messages
+
+    expected = StringIO()
+    TextInterface(board, expected).print_header("Neutron's Turn (Player 2)")
+    assert emulate_terminal(output.getvalue()) == emulate_terminal(expected.getvalue())
+
+
+def test_menus_use_output(monkeypatch, capsys):
+    output = StringIO()
+    interface = TextInterface(Board(), output)
+    answers = iter(["7", "3", "3", "2"])
+    monkeypatch.setattr("builtins.input", lambda: next(answers))
+
+    assert interface.select_game_mode() == "3"
+    assert interface.select_game_end(3) == 3
+    interface.print_winner(1)
+
+    text = output.getvalue()
+    assert text.count("Invalid input. Try again.") == 2
+    assert "Choose game mode:" in text
+    assert "Do you want to end the game?" in text
+    assert "Player 1 wins..." in text
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,101 @@
+from main import Board, BitBoard
+from transposition import (TranspositionTable, zobrist_hash, position_key, canonical_key, mirror_turn, mirror_coordinates,
+                           ZOBRIST_MIRRORED, EXACT, LOWER)
+from random import Random
+import pytest
+
+
+@pytest.mark.parametrize("board_class", [Board, BitBoard])
+def test_incremental_hash(board_class):
+    rng = Random(2)
+    board = board_class()
+    start = board.hash
+    player_id = 1
+    turns = list(board.generate_turns(player_id, neutron=False))
+    for _ in range(15):
+        board.make_move(rng.choice(turns))
+        assert board.hash == zobrist_hash(board.get_board())
+        assert board.mirror_hash == zobrist_hash(board.get_board(), ZOBRIST_MIRRORED)
+        player_id = 3 - player_id
+        turns = [turn for turn in board.generate_turns(player_id) if turn & 1023]
+        if turns == []:
+            break
+
+    while board.history:
+        board.unmake_move()
+    assert board.hash == start
+
+
+def test_replace_hash():
+    board = Board()
+    board.replace((4, 0), (1, 0))
+    assert board.hash == zobrist_hash(board.get_board())
+    assert board.hash == BitBoard(custom=board.get_board()).hash
+
+
+def test_position_key():
+    board = Board()
+    assert position_key(board, 1) != position_key(board, 2)
+
+
+def mirror_board(board):
+    return [row[::-1] for row in board]
+
+
+@pytest.mark.parametrize("board_class", [Board, BitBoard])
+def test_canonical_key(board_class):
+    rng = Random(5)
+    board = board_class()
+    assert canonical_key(board, 1) == (position_key(board, 1), False)
+    player_id = 1
+    for _ in range(10):
+        turns = [turn for turn in board.generate_turns(player_id) if turn & 1023]
+        if turns == []:
+            break
+        board.make_move(rng.choice(turns))
+        player_id = 3 - player_id
+
+        mirrored = board_class(custom=mirror_board(board.get_board()))
+        key, is_mirrored = canonical_key(board, player_id)
+        mirrored_key, mirrored_is_mirrored = canonical_key(mirrored, player_id)
+        assert key == mirrored_key
+        assert key == min(position_key(board, player_id), position_key(mirrored, player_id))
+        assert is_mirrored == (key != position_key(board, player_id))
+        assert canonical_key(board, 3 - player_id)[0] != key
+
+        # Turns of position map to turns of reflected position
+        assert sorted(mirror_turn(turn) for turn in board.generate_turns(player_id)) == sorted(mirrored.generate_turns(player_id))
+
+
+def test_mirror_moves():
+    assert mirror_coordinates((4, 1)) == (4, 3)
+    assert mirror_turn(0 << 10 | 20 * 25 + 15) == 24 * 25 + 19
+    for turn in (0, 12 * 25 + 7, (12 * 25 + 2) << 10 | 21 * 25 + 6):
+        assert mirror_turn(mirror_turn(turn)) == turn
+
+
+def test_table_store_probe():
+    table = TranspositionTable(memory=1024)
+    assert table.size == 64
+
+    table.store(12345, 3, EXACT, -990, 1023 << 10 | 5)
+    assert table.probe(12345) == (3, EXACT, -990, 1023 << 10 | 5)
+    assert table.probe(12345 + table.size) is None
+
+
+def test_table_replacement():
+    table = TranspositionTable(memory=1024)
+    key = 7
+    other_key = 7 + table.size
+
+    table.store(key, 5, EXACT, 10, 1)
+    table.store(other_key, 2, LOWER, 20, 2)
+    assert table.probe(key) == (5, EXACT, 10, 1)
+    assert table.probe(other_key) is None
+
+    table.store(other_key, 5, LOWER, 20, 2)
+    assert table.probe(other_key) == (5, LOWER, 20, 2)
+
+    table.new_search()
+    table.store(key, 1, EXACT, 30, 3)
+    assert table.probe(key) == (1, EXACT, 30, 3)
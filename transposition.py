@@ -0,0 +1,181 @@
+from array import array
+from random import Random
+
+
+# Zobrist keys
+# ZOBRIST[id][cell] is random 64-bit key of pawn with given id on cell (row * 5 + column).
+# Empty cells (id 0) have key 0, so hash of the board is xor of keys of all pawns.
+def build_zobrist(seed=2021):
+    """
+    Returns Zobrist keys for all pawn ids and cells.
+    """
+    rng = Random(seed)
+    return [[0] * 25] + [[rng.getrandbits(64) for cell in range(25)] for id in range(1, 4)]
+
+
+ZOBRIST = build_zobrist()
+ZOBRIST_PLAYER = Random(2022).getrandbits(64)
+
+# Mirror symmetry
+# Rules are symmetric under left-right reflection, MIRROR_CELLS[cell] is the reflected cell (column 4 - column).
+# ZOBRIST_MIRRORED[id][cell] is key of pawn on the reflected cell, so hash of the reflected board
+# is kept up to date the same way as hash of the board.
+MIRROR_CELLS = [row * 5 + 4 - column for row in range(5) for column in range(5)]
+ZOBRIST_MIRRORED = [[keys[MIRROR_CELLS[cell]] for cell in range(25)] for keys in ZOBRIST]
+
+
+def zobrist_hash(board, keys=ZOBRIST):
+    """
+    Returns Zobrist hash of the board.
+
+    :param board: Board
+    :type board: list of lists
+
+    :param keys: ZOBRIST or ZOBRIST_MIRRORED (hash of reflected board)
+    :type keys: list of lists
+    """
+    _hash = 0
+    for row in range(5):
+        for column in range(5):
+            _hash ^= keys[board[row][column]][row * 5 + column]
+    return _hash
+
+
+def position_key(board, player_id):
+    """
+    Returns key of position: Zobrist hash of the board with player who moves.
+
+    :param board: Board
+    :type board: Board
+
+    :param player_id: id of player who moves
+    :type player_id: int
+    """
+    if player_id == 2:
+        return board.hash ^ ZOBRIST_PLAYER
+    return board.hash
+
+
+def canonical_key(board, player_id):
+    """
+    Returns (key, mirrored): smaller of keys of the position and of its reflection (see position_key())
+    and True if key is of the reflection. Turns of reflected position are mapped by mirror_turn().
+
+    :param board: Board
+    :type board: Board
+
+    :param player_id: id of player who moves
+    :type player_id: int
+    """
+    key = board.hash
+    mirrored_key = board.mirror_hash
+    if player_id == 2:
+        key ^= ZOBRIST_PLAYER
+        mirrored_key ^= ZOBRIST_PLAYER
+    if mirrored_key < key:
+        return mirrored_key, True
+    return key, False
+
+
+def mirror_coordinates(coordinates):
+    """
+    Returns reflected coordinates.
+    """
+    row, column = coordinates
+    return row, 4 - column
+
+
+def mirror_slide(slide):
+    """
+    Returns reflected encoded slide (origin * 25 + target), 0 (no slide) stays 0.
+    """
+    if slide == 0:
+        return 0
+    return MIRROR_CELLS[slide // 25] * 25 + MIRROR_CELLS[slide % 25]
+
+
+def mirror_turn(turn):
+    """
+    Returns reflected encoded turn (neutron_slide << 10 | pawn_slide).
+    Reflection maps turns of the position to turns of the reflected position and back.
+    """
+    return mirror_slide(turn >> 10) << 10 | mirror_slide(turn & 1023)
+
+
+# Transposition table
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+
+class TranspositionTable:
+    """
+    Fixed-size hash table of search results backed by two arrays of 64-bit integers.
+    Entry data is packed as turn (20 bits), depth + 1 (8 bits), flag (2 bits),
+    generation (8 bits) and score + 32768 (16 bits).
+    Entry is replaced if it is from older search or new result is at least as deep.
+    :params memory: Maximal size of the table in bytes.
+    """
+    ENTRY_SIZE = 16
+
+    def __init__(self, memory=16 * 2 ** 20):
+        size = 1
+        while size * 2 * self.ENTRY_SIZE <= memory:
+            size *= 2
+        self.size = size
+        self.mask = size - 1
+        self.keys = array('Q', bytes(8 * size))
+        self.data = array('Q', bytes(8 * size))
+        self.generation = 0
+
+    def new_search(self):
+        """
+        Marks all stored entries as old, so they can be replaced by new search.
+        """
+        self.generation = (self.generation + 1) & 0xFF
+
+    def clear(self):
+        """
+        Removes all entries.
+        """
+        self.keys = array('Q', bytes(8 * self.size))
+        self.data = array('Q', bytes(8 * self.size))
+
+    def probe(self, key):
+        """
+        Returns (depth, flag, score, turn) stored for key or None.
+
+        :param key: Position key
+        :type key: int
+        """
+        index = key & self.mask
+        data = self.data[index]
+        if data == 0 or self.keys[index] != key:
+            return None
+        return (data >> 20 & 0xFF) - 1, data >> 28 & 0b11, (data >> 38) - 32768, data & 0xFFFFF
+
+    def store(self, key, depth, flag, score, turn):
+        """
+        Stores search result using depth-preferred replacement.
+
+        :param key: Position key
+        :type key: int
+
+        :param depth: Depth of search
+        :type depth: int
+
+        :param flag: EXACT, LOWER (score is lower bound) or UPPER (score is upper bound)
+        :type flag: int
+
+        :param score: Score of the position
+        :type score: int
+
+        :param turn: Best encoded turn or 0
+        :type turn: int
+        """
+        index = key & self.mask
+        data = self.data[index]
+        if data != 0 and self.keys[index] != key and data >> 30 & 0xFF == self.generation and (data >> 20 & 0xFF) - 1 > depth:
+            return
+        self.keys[index] = key
+        self.data[index] = turn | (depth + 1) << 20 | flag << 28 | self.generation << 30 | (score + 32768) << 38